@@ -0,0 +1,115 @@
+"""Sorted non-dominated archive for bi-objective random search.
+
+The archive keeps its points ordered by f1. In a mutually non-dominated set
+f2 then decreases, so for a candidate c = (a, b):
+
+- only the last point with f1 <= a can dominate c (it has the smallest f2
+  of those), which one bisect finds;
+- the points c dominates (f1 >= a and f2 >= b) form one contiguous run
+  starting at the first f1 >= a, whose end a second bisect on -f2 finds.
+  The run is removed with a single slice deletion.
+
+The columns are plain Python lists, so each insertion or deletion costs one
+C-level memmove on top of the O(log n) searches. Exact duplicates are kept.
+`points()` returns the archive in insertion order, like the list-based
+archive it replaces. The searches are written out so that `comparisons` can
+count every key comparison they make, plus the one dominance test per
+candidate.
+
+`skyline_2d` reduces a whole evaluated chunk to its own non-dominated rows
+with one sort and a running minimum, so batched random search only feeds
+chunk skylines to the archive.
+"""
+
+import numpy as np
+
+
+def _bisect_left(keys, x, lo, hi):
+    # bisect.bisect_left, also returning the number of key comparisons
+    n = 0
+    while lo < hi:
+        mid = (lo + hi) // 2
+        n += 1
+        if keys[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo, n
+
+
+def _bisect_right(keys, x, lo, hi):
+    # bisect.bisect_right, also returning the number of key comparisons
+    n = 0
+    while lo < hi:
+        mid = (lo + hi) // 2
+        n += 1
+        if x < keys[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo, n
+
+
+class ParetoArchive2D:
+
+    def __init__(self):
+        self._f1 = []
+        self._neg_f2 = []  # -f2, non-decreasing along the f1 order
+        self._seq = []     # insertion counter, to report points in arrival order
+        self._count = 0
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self._f1)
+
+    def add(self, point):
+        # returns True when `point` enters the archive
+        a, b = point[0], point[1]
+        f1, neg_f2 = self._f1, self._neg_f2
+        k, n = _bisect_right(f1, a, 0, len(f1))
+        self.comparisons += n + (k > 0)
+        if k and -neg_f2[k - 1] <= b and (f1[k - 1] < a or -neg_f2[k - 1] < b):
+            return False
+        lo, n = _bisect_left(f1, a, 0, k)
+        self.comparisons += n
+        if lo < k and neg_f2[lo] == -b:
+            # exact duplicates already present: nothing here is dominated by c
+            pos, hi = k, k
+        else:
+            pos, (hi, n) = lo, _bisect_right(neg_f2, -b, lo, len(neg_f2))
+            self.comparisons += n
+        f1[pos:hi] = [a]
+        neg_f2[pos:hi] = [-b]
+        self._seq[pos:hi] = [self._count]
+        self._count += 1
+        return True
+
+    @property
+    def inserted(self):
+        # points that ever entered the archive (some may have been evicted since)
+        return self._count
+
+    def update(self, points):
+        for p in points:
+            self.add(p)
+
+    def sorted_points(self):
+        # (f1, f2) tuples in increasing f1
+        return [(a, -nb) for a, nb in zip(self._f1, self._neg_f2)]
+
+    def points(self):
+        # (f1, f2) tuples in the order they entered the archive
+        order = sorted(range(len(self._seq)), key=self._seq.__getitem__)
+        return [(self._f1[i], -self._neg_f2[i]) for i in order]
+
+
+def skyline_2d(objs):
+    # objs: (n, 2) array; returns its non-dominated rows sorted by (f1, f2).
+    # After a lexicographic sort a row can only be dominated by an earlier one,
+    # so it survives when its f2 does not exceed the running minimum of the
+    # f2 values before it. Rows with equal f2 but larger f1 slip through;
+    # ParetoArchive2D.add rejects those exactly.
+    objs = np.asarray(objs, dtype=float)
+    s = objs[np.lexsort((objs[:, 1], objs[:, 0]))]
+    prev_min = np.minimum.accumulate(np.concatenate(([np.inf], s[:-1, 1])))
+    return s[s[:, 1] <= prev_min]
@@ -0,0 +1,84 @@
+"""Checkpoint files for resuming `nsga2()` runs.
+
+A checkpoint is one uncompressed .npz holding everything the generation loop
+needs to continue as if it had never stopped:
+
+- the population buffers (genomes, objectives, rank, crowding and, with delta
+  evaluation, the carried gene sums);
+- the state of the module-level `random` generator and of the NumPy
+  generator used by the batched operators;
+- the number of completed generations, the evaluation counter and the
+  convergence history so far;
+- the run configuration, so a file is not resumed into a different run;
+- optional `extra` JSON state, which nsga2 uses for its phase timer and
+  operation counters so they cover the whole run after a resume.
+
+Files are written to a temporary name and renamed over the old checkpoint, so
+a run killed while saving still leaves the previous checkpoint intact. Nothing
+is pickled; loading never executes code from the file.
+"""
+
+import json
+import os
+import random
+
+import numpy as np
+
+
+def _random_state_arrays():
+    version, internal, gauss_next = random.getstate()
+    return (np.array(internal, dtype=np.uint64),
+            np.array([version, np.nan if gauss_next is None else gauss_next]))
+
+
+def _set_random_state(internal, meta):
+    version, gauss_next = meta
+    random.setstate((int(version), tuple(int(v) for v in internal),
+                     None if np.isnan(gauss_next) else float(gauss_next)))
+
+
+def save_checkpoint(path, config, pop, rng, generation, evals, history, extra=None):
+    # config: dict of run parameters; history: dict of per-generation lists;
+    # extra: JSON-serialisable dict returned as is by load_checkpoint
+    internal, meta = _random_state_arrays()
+    arrays = {
+        'genomes': pop.genomes[:pop.size],
+        'objs': pop.objs[:pop.size],
+        'rank': pop.rank,
+        'crowding': pop.crowding,
+        'random_internal': internal,
+        'random_meta': meta,
+        'numpy_rng': np.array(json.dumps(rng.bit_generator.state)),
+        'config': np.array(json.dumps(config, sort_keys=True)),
+        'counters': np.array([generation, evals], dtype=np.int64),
+        'extra': np.array(json.dumps(extra or {})),
+    }
+    if pop.gene_sums is not None:
+        arrays['gene_sums'] = pop.parent_sums
+    for key, values in history.items():
+        arrays['history_' + key] = np.asarray(values)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path, config, pop, rng):
+    # restores pop, `random` and rng in place; returns (generation, evals, history, extra)
+    with np.load(path) as data:
+        saved = json.loads(str(data['config']))
+        if saved != json.loads(json.dumps(config, sort_keys=True)):
+            raise ValueError(f'checkpoint {path} was written by a different run: {saved}')
+        pop.parents[:] = data['genomes']
+        pop.parent_objs[:] = data['objs']
+        pop.rank[:] = data['rank']
+        pop.crowding[:] = data['crowding']
+        if pop.gene_sums is not None:
+            pop.parent_sums[:] = data['gene_sums']
+        _set_random_state(data['random_internal'], data['random_meta'])
+        rng.bit_generator.state = json.loads(str(data['numpy_rng']))
+        generation, evals = (int(v) for v in data['counters'])
+        history = {key[len('history_'):]: data[key].tolist()
+                   for key in data.files if key.startswith('history_')}
+        extra = json.loads(str(data['extra']))
+    return generation, evals, history, extra
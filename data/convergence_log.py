@@ -0,0 +1,85 @@
+"""Append-only, line-delimited convergence log for `nsga2()`.
+
+With `track_convergence=True, metric_sink=ConvergenceLog(path)` every tracked
+generation is written as one JSON object per line as soon as it is known,
+instead of being collected in the lists of the returned `convergence_data`:
+
+    {"generation": 1, "hypervolume": 0.41, "spacing": 0.012, "pareto_size": 9}
+
+Lines are flushed every `flush_every` records (and on `close()`), so another
+process can tail the file while the run is going, and a crash loses at most
+the unflushed records. A resumed run needs the log opened with `append=True`;
+nsga2 truncates it to the checkpoint's generation and refuses a log that
+lacks earlier generations. `read_convergence_log` returns the usual dict of
+per-metric lists and ignores a trailing partial line.
+"""
+
+import json
+import os
+
+FIELDS = ('generation', 'hypervolume', 'spacing', 'pareto_size')
+
+
+class ConvergenceLog:
+
+    def __init__(self, path, flush_every=1, append=False):
+        # append=True keeps existing records (resuming a checkpointed run)
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self._pending = 0
+        self._file = open(path, 'a' if append else 'w')
+
+    def write(self, generation, hypervolume, spacing, pareto_size):
+        record = dict(zip(FIELDS, (generation, hypervolume, spacing, pareto_size)))
+        self._file.write(json.dumps(record) + '\n')
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self._file.flush()
+        self._pending = 0
+
+    def truncate(self, generation):
+        # drop records after `generation`, e.g. when a run resumes from a
+        # checkpoint; later writes append after the kept records. Raises
+        # ValueError if records 1..generation are not all there, e.g. because
+        # the log was not opened with append=True
+        self.flush()
+        kept = [record for record in _records(self.path) if record['generation'] <= generation]
+        if len(kept) < generation:
+            raise ValueError(f'{self.path} holds {len(kept)} of the first {generation} generations; '
+                             'open it with append=True to resume')
+        self._file.close()
+        with open(self.path, 'w') as f:
+            f.writelines(json.dumps(record) + '\n' for record in kept)
+        self._file = open(self.path, 'a')
+        self._pending = 0
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _records(path):
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path) as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break  # still being written
+            records.append(json.loads(line))
+    return records
+
+
+def read_convergence_log(path):
+    # {'generation': [...], 'hypervolume': [...], 'spacing': [...], 'pareto_size': [...]}
+    records = _records(path)
+    return {field: [record[field] for record in records] for field in FIELDS}
@@ -0,0 +1,99 @@
+"""Columnar storage for the convergence data used by the plot scripts.
+
+`generate_convergence_data.py` writes `convergence_data/<alg>_<problem>_convergence.json`,
+a pretty-printed document with one number per line. The same data is kept
+here as a directory of raw arrays next to it:
+
+    convergence_data/<alg>_<problem>_convergence/
+        header.json                  config plus the array names
+        avg_<field>.npy              averaged_data[field], one value per generation
+        runs_<metric>.npy            all_runs as an (n_runs, n_generations) matrix
+
+`load_convergence` memory-maps the arrays, so loading costs a few file opens
+rather than a parse. Results are cached per process, keyed by path and header
+mtime, so every figure of a plot script reuses them. A JSON file without a
+store, or newer than its store, is converted the first time it is loaded.
+Runs of unequal length are padded with NaN in the run matrices.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+_cache = {}
+
+
+def store_path(json_path):
+    # convergence_data/x_convergence.json -> convergence_data/x_convergence/
+    json_path = Path(json_path)
+    return json_path.with_suffix('')
+
+
+def save_convergence(directory, config, averaged_data, all_runs):
+    directory = Path(directory)
+    tmp = directory.with_name(directory.name + '.tmp')
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir(parents=True)
+    for field, values in averaged_data.items():
+        np.save(tmp / f'avg_{field}.npy', np.asarray(values))
+    metrics = sorted({metric for run in all_runs for metric in run})
+    for metric in metrics:
+        columns = [np.asarray(run.get(metric, []), dtype=float) for run in all_runs]
+        matrix = np.full((len(columns), max((len(c) for c in columns), default=0)), np.nan)
+        for i, column in enumerate(columns):
+            matrix[i, :len(column)] = column
+        np.save(tmp / f'runs_{metric}.npy', matrix)
+    header = {'config': config, 'averaged_data': list(averaged_data), 'all_runs': metrics}
+    # header last: a store without one is incomplete
+    with open(tmp / 'header.json', 'w') as f:
+        json.dump(header, f)
+    if directory.exists():
+        shutil.rmtree(directory)
+    os.replace(tmp, directory)
+
+
+def convert_json(json_path):
+    # writes the columnar store of one convergence JSON file; returns its path
+    with open(json_path) as f:
+        data = json.load(f)
+    directory = store_path(json_path)
+    save_convergence(directory, data.get('config', {}), data['averaged_data'], data.get('all_runs', []))
+    return directory
+
+
+def _is_stale(json_path, header):
+    if not header.exists():
+        return True
+    return json_path.exists() and json_path.stat().st_mtime_ns > header.stat().st_mtime_ns
+
+
+def load_convergence(json_path):
+    # {'config': ..., 'averaged_data': {field: array}, 'all_runs': {metric: (runs, gens) array}},
+    # or None when neither the JSON file nor its store exists
+    json_path = Path(json_path)
+    directory = store_path(json_path)
+    header = directory / 'header.json'
+    if _is_stale(json_path, header):
+        if not json_path.exists():
+            return None
+        convert_json(json_path)
+    key = str(directory.resolve())
+    mtime = header.stat().st_mtime_ns
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(header) as f:
+        meta = json.load(f)
+    data = {
+        'config': meta['config'],
+        'averaged_data': {field: np.load(directory / f'avg_{field}.npy', mmap_mode='r')
+                          for field in meta['averaged_data']},
+        'all_runs': {metric: np.load(directory / f'runs_{metric}.npy', mmap_mode='r')
+                     for metric in meta['all_runs']},
+    }
+    _cache[key] = (mtime, data)
+    return data
@@ -0,0 +1,62 @@
+"""Array-based crowding distance shared by the NSGA-II scripts.
+
+`crowding_distance_array` computes the same values as the dict-based
+`crowding_distance` the scripts used to have, including the optional `fixed_bounds`
+normalisation of the *_crowd_fixedref variants, but with one stable argsort
+per objective and vectorised neighbour gaps. Boundary points get a native
+`inf`, and the result is a float vector aligned with the `front` index array,
+so callers index it by position instead of looking individuals up in a dict.
+
+`top_k_crowding` picks the survivors of an overflowing front with
+`np.argpartition` instead of sorting the whole front, and returns exactly the
+prefix `crowding_order` would.
+"""
+
+import numpy as np
+
+
+def crowding_distance_array(pop_objs, front, fixed_bounds=None):
+    # pop_objs: (n, M) objectives; front: indices into pop_objs
+    # fixed_bounds: ((f1_min,f1_max),(f2_min,f2_max),...) used to normalize when provided
+    front = np.asarray(front, dtype=np.intp)
+    vals = np.asarray(pop_objs, dtype=float)[front]
+    dist = np.zeros(len(front))
+    if len(front) == 0:
+        return dist
+    for m in range(vals.shape[1]):
+        order = np.argsort(vals[:, m], kind='stable')
+        v = vals[order, m]
+        if fixed_bounds is not None:
+            minv, maxv = fixed_bounds[m]
+        else:
+            minv, maxv = v[0], v[-1]
+        # boundary points get infinite distance
+        dist[order[0]] = np.inf
+        dist[order[-1]] = np.inf
+        denom = maxv - minv
+        if denom == 0 or len(front) < 3:
+            continue
+        # gap between the two sorted neighbours of every interior point
+        dist[order[1:-1]] += (v[2:] - v[:-2]) / denom
+    return dist
+
+
+def crowding_order(dist):
+    # positions sorted by distance descending (inf first), ties kept in front order
+    return np.argsort(-dist, kind='stable')
+
+
+def top_k_crowding(dist, k):
+    # the first k positions of crowding_order(dist), found with argpartition in
+    # O(F) and then ordered in O(k log k). Ties at the threshold (including
+    # inf) go to the earliest positions, as with the stable sort.
+    if k >= len(dist):
+        return crowding_order(dist)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    neg = -dist
+    threshold = neg[np.argpartition(neg, k - 1)[k - 1]]
+    better = np.flatnonzero(neg < threshold)
+    ties = np.flatnonzero(neg == threshold)[:k - len(better)]
+    chosen = np.concatenate((better, ties))
+    return chosen[np.lexsort((chosen, neg[chosen]))]
@@ -0,0 +1,170 @@
+"""Pluggable objective evaluation for `nsga2()`.
+
+An evaluator receives a whole batch of genomes, a (rows, n_var) array, and
+returns a (rows, n_obj) float array. `func` is either a batched kernel such as
+`problems.zdt1_batch` (batched=True) or a per-individual objective returning
+a tuple (batched=False), which is the usual shape of an expensive user
+objective.
+
+- SerialEvaluator: evaluates in the calling thread.
+- ThreadPoolEvaluator: splits the batch into chunks for a ThreadPoolExecutor
+  (useful when the objective releases the GIL, e.g. NumPy or I/O bound).
+- ProcessPoolEvaluator: same over a ProcessPoolExecutor; `func` must be
+  picklable (a module-level function).
+
+Pools are started on first use and kept alive across generations (and runs)
+until `close()`. They are not pickled, so an evaluator can be handed to
+worker processes by `runs.run_repetitions`, and each worker starts its own
+pool there.
+
+CachedEvaluator memoises any evaluator. Rows are keyed by their raw genome
+bytes in a bounded LRU, and only the distinct unseen genomes of a batch go to
+the wrapped evaluator. `hits` counts the objective calls it saved, including
+repeats within one batch, and `misses` counts the calls actually made.
+Counters are per process.
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+
+def _evaluate_chunk(func, batched, genomes):
+    if batched:
+        return np.asarray(func(genomes), dtype=float)
+    return np.array([func(ind) for ind in genomes], dtype=float)
+
+
+class Evaluator:
+
+    def __init__(self, func, batched=False, chunk_size=None):
+        self.func = func
+        self.batched = batched
+        self.chunk_size = chunk_size
+
+    def evaluate(self, genomes):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SerialEvaluator(Evaluator):
+
+    def evaluate(self, genomes):
+        return _evaluate_chunk(self.func, self.batched, genomes)
+
+
+class _PoolEvaluator(Evaluator):
+    executor_class = None
+
+    def __init__(self, func, batched=False, chunk_size=None, workers=None):
+        super().__init__(func, batched=batched, chunk_size=chunk_size)
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+
+    def _chunks(self, genomes):
+        # default: one contiguous chunk per worker
+        size = self.chunk_size or -(-len(genomes) // self.workers)
+        return [genomes[i:i + size] for i in range(0, len(genomes), size)]
+
+    def evaluate(self, genomes):
+        if len(genomes) == 0:
+            return _evaluate_chunk(self.func, self.batched, genomes)
+        if self._executor is None:
+            self._executor = self.executor_class(max_workers=self.workers)
+        parts = self._executor.map(_evaluate_chunk, repeat(self.func), repeat(self.batched),
+                                   self._chunks(genomes))
+        return np.concatenate(list(parts))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        return state
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    executor_class = ThreadPoolExecutor
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    executor_class = ProcessPoolExecutor
+
+
+class CachedEvaluator(Evaluator):
+
+    def __init__(self, inner, max_size=100000):
+        super().__init__(inner.func, batched=inner.batched, chunk_size=inner.chunk_size)
+        self.inner = inner
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def evaluate(self, genomes):
+        genomes = np.ascontiguousarray(genomes)
+        if len(genomes) == 0:
+            return self.inner.evaluate(genomes)
+        # one bytes key per row, straight from the buffer
+        keys = genomes.view(np.dtype((np.void, genomes.dtype.itemsize * genomes.shape[1]))).ravel().tolist()
+        results = [None] * len(keys)
+        missing = OrderedDict()  # key -> rows of this batch waiting for it
+        for i, key in enumerate(keys):
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                results[i] = value
+                self.hits += 1
+            elif key in missing:
+                missing[key].append(i)
+                self.hits += 1
+            else:
+                missing[key] = [i]
+                self.misses += 1
+        if missing:
+            fresh = self.inner.evaluate(genomes[[rows[0] for rows in missing.values()]])
+            for (key, rows), value in zip(missing.items(), fresh):
+                # a copy, so an entry does not keep the whole batch alive
+                value = value.copy()
+                self._cache[key] = value
+                for i in rows:
+                    results[i] = value
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return np.array(results)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache)}
+
+    def close(self):
+        self.inner.close()
+
+
+EVALUATORS = {
+    'serial': SerialEvaluator,
+    'thread': ThreadPoolEvaluator,
+    'process': ProcessPoolEvaluator,
+}
+
+
+def make_evaluator(kind, func, batched=False, chunk_size=None, workers=None):
+    # kind: one of EVALUATORS ('serial', 'thread', 'process')
+    if kind not in EVALUATORS:
+        raise ValueError(f'unknown evaluator {kind!r}, expected one of {sorted(EVALUATORS)}')
+    if kind == 'serial':
+        return SerialEvaluator(func, batched=batched, chunk_size=chunk_size)
+    return EVALUATORS[kind](func, batched=batched, chunk_size=chunk_size, workers=workers)
@@ -0,0 +1,120 @@
+"""Island-model NSGA-II: K populations in K processes with periodic migration.
+
+Every island runs a script's `nsga2()` in its own process, seeded from
+(seed, island). Every `migration_interval` generations, nsga2's
+`on_generation` hook sends the island's best non-dominated individuals to
+one neighbour. These are the least crowded members of its first front, up to
+`n_migrants` of them. The island then receives the same number from its own
+source, and the immigrants replace the last rows of the population. Survival
+stores parents front by front, so those rows are the worst-ranked ones. The
+hook reports the replacement, so nsga2 ranks the parents again after a
+migration; in the other generations the loop runs exactly as without islands.
+
+Topologies (each island sends and receives exactly one message per
+migration, so the exchange is deterministic):
+- 'ring':   island i sends to island (i+1) % K;
+- 'random': a fresh random ring per migration, drawn from (seed, migration)
+  identically on every island.
+
+The final Pareto front is the non-dominated subset of the union of all
+island fronts, and `evals` is the total over islands.
+"""
+
+import multiprocessing as mp
+import queue
+import random
+
+import numpy as np
+
+from crowding import crowding_distance_array, top_k_crowding
+from nondominated import fast_non_dominated_sort
+from runs import run_seed
+
+TOPOLOGIES = ('ring', 'random')
+
+
+def migration_targets(n_islands, topology, seed, migration):
+    # dest[i] = island that receives island i's emigrants at this migration
+    if topology == 'ring':
+        order = np.arange(n_islands)
+    elif topology == 'random':
+        order = np.random.default_rng([seed, migration]).permutation(n_islands)
+    else:
+        raise ValueError(f'unknown topology {topology!r}, expected one of {TOPOLOGIES}')
+    dest = np.empty(n_islands, dtype=int)
+    dest[order] = np.roll(order, -1)
+    return dest
+
+
+def _emigrants(pop, n_migrants):
+    objs = pop.parent_objs
+    front = np.asarray(fast_non_dominated_sort(objs)[0])
+    dist = crowding_distance_array(objs, front)
+    chosen = front[top_k_crowding(dist, n_migrants)]
+    return pop.parents[chosen].copy(), objs[chosen].copy()
+
+
+def _island_worker(island, nsga2_fn, n_islands, seed, migration_interval, n_migrants,
+                   topology, inboxes, results, kwargs):
+    random.seed(run_seed(seed, island))
+
+    def migrate(gen, pop):
+        if (gen + 1) % migration_interval:
+            return False
+        migration = (gen + 1) // migration_interval
+        dest = migration_targets(n_islands, topology, seed, migration)[island]
+        inboxes[dest].put(_emigrants(pop, n_migrants))
+        genomes, objs = inboxes[island].get()
+        # immigrants overwrite the worst-ranked rows
+        k = len(genomes)
+        pop.parents[pop.size - k:] = genomes
+        pop.parent_objs[pop.size - k:] = objs
+        return True
+
+    evaluator = kwargs.get('evaluator')
+    try:
+        pareto, evals = nsga2_fn(on_generation=migrate, **kwargs)[:2]
+    finally:
+        # this island's copy of a pooled evaluator started its own workers;
+        # left open, they keep the island process from exiting
+        if evaluator is not None:
+            evaluator.close()
+    results.put((island, pareto, evals))
+
+
+def island_nsga2(nsga2_fn, n_islands=4, migration_interval=10, n_migrants=5,
+                 topology='ring', seed=None, **kwargs):
+    # nsga2_fn: a script's module-level nsga2; kwargs are passed to every island
+    if topology not in TOPOLOGIES:
+        raise ValueError(f'unknown topology {topology!r}, expected one of {TOPOLOGIES}')
+    if seed is None:
+        # derived from the caller's random state, so runs.run_repetitions stays reproducible
+        seed = random.getrandbits(64)
+    kwargs.pop('track_convergence', None)
+    ctx = mp.get_context()
+    inboxes = [ctx.Queue() for _ in range(n_islands)]
+    results = ctx.Queue()
+    workers = [ctx.Process(target=_island_worker,
+                           args=(i, nsga2_fn, n_islands, seed, migration_interval, n_migrants,
+                                 topology, inboxes, results, kwargs))
+               for i in range(n_islands)]
+    for w in workers:
+        w.start()
+    # drain results before joining so large fronts cannot block the queue
+    fronts = []
+    while len(fronts) < n_islands:
+        try:
+            fronts.append(results.get(timeout=1.0))
+        except queue.Empty:
+            failed = [i for i, w in enumerate(workers) if w.exitcode not in (None, 0)]
+            if failed:
+                for w in workers:
+                    w.terminate()
+                raise RuntimeError(f'island process(es) {failed} failed')
+    for w in workers:
+        w.join()
+    fronts.sort(key=lambda r: r[0])
+    merged = [p for _, pareto, _ in fronts for p in pareto]
+    evals = sum(e for _, _, e in fronts)
+    pareto = [merged[i] for i in fast_non_dominated_sort(merged)[0]] if merged else []
+    return pareto, evals
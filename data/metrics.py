@@ -0,0 +1,72 @@
+"""Quality metrics shared by the NSGA-II and random-search scripts.
+
+`spacing` gives the same values as the original all-pairs implementation. It
+only changes how each point's L1 nearest-neighbour distance is found:
+
+- mutually non-dominated bi-objective sets (every Pareto front, every random
+  search archive): after sorting by f1 (f2 then decreases), the L1 distance
+  to the j-th next point grows with j, so the nearest neighbour is one of
+  the two sorted neighbours: O(n log n);
+- anything else (dominated points, more objectives): a KD-tree query with
+  p=1 (scipy.spatial.cKDTree), or a blocked NumPy all-pairs scan when SciPy
+  is not installed.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # optional dependency
+    cKDTree = None
+
+# rows per block of the NumPy all-pairs fallback
+_BLOCK = 512
+
+
+def _nearest_l1_sorted_2d(pts):
+    # None unless pts is a mutually non-dominated bi-objective set
+    order = np.lexsort((pts[:, 1], pts[:, 0]))
+    step = np.diff(pts[order], axis=0)
+    duplicate = (step[:, 0] == 0) & (step[:, 1] == 0)
+    if not np.all((step[:, 1] < 0) | duplicate):
+        return None
+    gap = np.abs(step[:, 0]) + np.abs(step[:, 1])
+    nearest = np.empty(len(pts))
+    nearest[order] = np.minimum(np.append(np.inf, gap), np.append(gap, np.inf))
+    return nearest
+
+
+def _nearest_l1_general(pts):
+    if cKDTree is not None:
+        # k=2: the closest hit is the point itself (or an identical copy)
+        return cKDTree(pts).query(pts, k=2, p=1)[0][:, 1]
+    nearest = np.empty(len(pts))
+    for start in range(0, len(pts), _BLOCK):
+        block = np.abs(pts[start:start + _BLOCK, None, :] - pts[None, :, :]).sum(axis=2)
+        rows = np.arange(len(block))
+        block[rows, start + rows] = np.inf
+        nearest[start:start + _BLOCK] = block.min(axis=1)
+    return nearest
+
+
+def nearest_l1_distances(front):
+    # front: (n, M) points, n >= 2; L1 distance from each point to its nearest other point
+    pts = np.asarray(front, dtype=float)
+    nearest = None
+    if pts.shape[1] == 2:
+        nearest = _nearest_l1_sorted_2d(pts)
+    if nearest is None:
+        nearest = _nearest_l1_general(pts)
+    return nearest
+
+
+def spacing(front):
+    # as defined in slides: measure distribution uniformity on the front
+    if len(front) <= 1:
+        return 0.0
+    d = nearest_l1_distances(front).tolist()
+    mean_d = sum(d)/len(d)
+    var = sum((di - mean_d)**2 for di in d) / (len(d)-1) if len(d)>1 else 0.0
+    return math.sqrt(var)
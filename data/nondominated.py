@@ -0,0 +1,228 @@
+"""Fast non-dominated sorting shared by the NSGA-II scripts.
+
+The scripts originally used an all-pairs `non_dominated_sort` (O(M N^2)
+comparisons plus one set per individual). For bi-objective problems `nsga2()`
+now uses `non_dominated_sort_2d`, which assigns fronts in O(N log N)
+following Jensen (2003) / Fortin et al. (2013):
+
+- sort points lexicographically by (f1, f2);
+- every front remembers its last (lowest f2) member;
+- a point goes to the first front whose last member does not dominate it,
+  found by binary search because those keys stay sorted across fronts.
+
+With more objectives `non_dominated_sort_ens` implements Efficient
+Non-dominated Sort with binary search (ENS-BS, Zhang et al. 2015):
+
+- sort points lexicographically, so a point can only be dominated by points
+  before it;
+- a point goes to the first front with no member dominating it. That is
+  found by binary search, because a front that dominates it implies all
+  earlier fronts do too. Each probe is one vectorised comparison against
+  that front's members, with no all-pairs matrix and no per-individual sets.
+
+`fast_non_dominated_sort` dispatches on the number of objectives.
+
+Survival only needs the leading fronts that cover N of the 2N union.
+`peel_fronts(pop_objs, n_stop)` runs the same engines but keeps track of the
+first front at which the running total reaches n_stop. A point that would
+land beyond that front is not ranked; it goes to an `unranked` tail without
+probing the deeper fronts. Fronts that fall behind the cut later move to the
+tail as well. The fronts it returns are exactly the leading fronts of a full
+sort.
+
+Fronts are lists of indices into `pop_objs` in increasing index order. They
+have the same membership as the all-pairs sort, and front 0
+also has the same order. Deeper fronts come out of the all-pairs version in
+discovery order, which follows Python set iteration. Ties in survival, such
+as the two boundary points and `random.sample` under no_crowding, depend on
+that order, so seeded runs differ from those made with the all-pairs sort.
+
+`unique_rows` splits a union into the first copy of every distinct objective
+vector and the repeats, with one `np.unique` over a byte view of the rows.
+`nsga2(dedup=True)` sorts only the first copies and keeps the repeats as a
+last front. A repeat is either an identical genome or a distinct genome with
+identical objectives.
+"""
+
+import numpy as np
+
+
+class _Cutoff:
+    # tracks `limit`, the first front at which the running front sizes reach
+    # n_stop (len(fronts) while they do not). Points ranked beyond it are unranked.
+
+    def __init__(self, n_stop):
+        self.n_stop = n_stop
+        self.sizes = []
+        self.limit = 0
+        self.below = 0  # sum(sizes[:limit])
+
+    def place(self, k):
+        # record a point on front k <= limit
+        if k == len(self.sizes):
+            self.sizes.append(0)
+        self.sizes[k] += 1
+        if k < self.limit:
+            self.below += 1
+            while self.limit > 0 and self.below >= self.n_stop:
+                self.limit -= 1
+                self.below -= self.sizes[self.limit]
+        elif self.below + self.sizes[k] < self.n_stop:
+            # the new front does not cover n_stop yet; keep going
+            self.limit += 1
+            self.below += self.sizes[k]
+
+
+def _finish(fronts, unranked, cutoff):
+    if cutoff is not None:
+        for front in fronts[cutoff.limit + 1:]:
+            unranked.extend(front)
+        del fronts[cutoff.limit + 1:]
+    for front in fronts:
+        front.sort()
+    unranked.sort()
+    return fronts, unranked
+
+
+def _sort_2d(objs, n_stop, counts=None):
+    order = np.lexsort((objs[:, 1], objs[:, 0])).tolist()
+    f1 = objs[:, 0].tolist()
+    f2 = objs[:, 1].tolist()
+    cutoff = _Cutoff(n_stop) if n_stop is not None else None
+    # keys[k] = (f2, f1) of the last point placed in front k. A front dominates
+    # point p exactly when its key is lexicographically smaller than p's key,
+    # so the first non-dominating front is bisect_left(keys, key_p).
+    keys = []
+    fronts = []
+    unranked = []
+    compared = 0  # front keys compared against incoming points
+    for i in order:
+        key = (f2[i], f1[i])
+        # bisect_left(keys, key, 0, hi), written out to count the comparisons
+        k = 0
+        hi = len(keys) if cutoff is None else min(cutoff.limit + 1, len(keys))
+        while k < hi:
+            mid = (k + hi) // 2
+            compared += 1
+            if keys[mid] < key:
+                k = mid + 1
+            else:
+                hi = mid
+        if cutoff is not None:
+            if k > cutoff.limit:
+                unranked.append(i)
+                continue
+            cutoff.place(k)
+        if k == len(keys):
+            keys.append(key)
+            fronts.append([i])
+        else:
+            keys[k] = key
+            fronts[k].append(i)
+    if counts is not None:
+        counts.add('dominance_comparisons', compared)
+    return _finish(fronts, unranked, cutoff)
+
+
+def non_dominated_sort_2d(pop_objs):
+    # pop_objs: (n,2) array or sequence of (f1,f2); returns fronts as lists of indices
+    objs = np.asarray(pop_objs, dtype=float)
+    if len(objs) == 0:
+        return []
+    return _sort_2d(objs, None)[0]
+
+
+class _FrontRows:
+    # growable (rows, M) buffer holding one front's objective vectors
+
+    def __init__(self, n_obj):
+        self.rows = np.empty((4, n_obj))
+        self.count = 0
+
+    def append(self, row):
+        if self.count == len(self.rows):
+            self.rows = np.concatenate((self.rows, np.empty_like(self.rows)))
+        self.rows[self.count] = row
+        self.count += 1
+
+    def dominates(self, row):
+        # does any member dominate `row`?
+        members = self.rows[:self.count]
+        return bool(np.any(np.all(members <= row, axis=1) & np.any(members < row, axis=1)))
+
+
+def _sort_ens(objs, n_stop, counts=None):
+    order = np.lexsort(objs.T[::-1])
+    cutoff = _Cutoff(n_stop) if n_stop is not None else None
+    front_rows = []
+    fronts = []
+    unranked = []
+    compared = 0  # front members tested against the incoming point
+    for i in order.tolist():
+        row = objs[i]
+        lo = 0
+        hi = len(fronts) if cutoff is None else min(cutoff.limit + 1, len(fronts))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            compared += front_rows[mid].count
+            if front_rows[mid].dominates(row):
+                lo = mid + 1
+            else:
+                hi = mid
+        if cutoff is not None:
+            if lo > cutoff.limit:
+                unranked.append(i)
+                continue
+            cutoff.place(lo)
+        if lo == len(fronts):
+            front_rows.append(_FrontRows(objs.shape[1]))
+            fronts.append([])
+        front_rows[lo].append(row)
+        fronts[lo].append(i)
+    if counts is not None:
+        counts.add('dominance_comparisons', compared)
+    return _finish(fronts, unranked, cutoff)
+
+
+def non_dominated_sort_ens(pop_objs):
+    # pop_objs: (n, M) array or sequence of objective vectors, any M
+    objs = np.asarray(pop_objs, dtype=float)
+    if len(objs) == 0:
+        return []
+    return _sort_ens(objs, None)[0]
+
+
+def fast_non_dominated_sort(pop_objs, counts=None):
+    # O(N log N) for two objectives, ENS-BS otherwise; counts: optional
+    # opcounts.OpCounters charged with the dominance comparisons
+    objs = np.asarray(pop_objs, dtype=float)
+    if counts is not None and len(objs):
+        return (_sort_2d if objs.shape[1] == 2 else _sort_ens)(objs, None, counts)[0]
+    if objs.ndim == 2 and objs.shape[1] == 2:
+        return non_dominated_sort_2d(objs)
+    return non_dominated_sort_ens(objs)
+
+
+def unique_rows(pop_objs):
+    # (first, repeats): sorted indices of the first occurrence of every
+    # distinct row, and of all later copies
+    objs = np.ascontiguousarray(pop_objs, dtype=float)
+    if len(objs) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    keys = objs.view(np.dtype((np.void, objs.dtype.itemsize * objs.shape[1]))).ravel()
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    repeat = np.ones(len(objs), dtype=bool)
+    repeat[first] = False
+    return first, np.flatnonzero(repeat)
+
+
+def peel_fronts(pop_objs, n_stop, counts=None):
+    # leading fronts until they hold at least n_stop points, plus the sorted
+    # indices that were left unranked: (fronts, unranked)
+    objs = np.asarray(pop_objs, dtype=float)
+    if len(objs) == 0:
+        return [], []
+    if objs.shape[1] == 2:
+        return _sort_2d(objs, n_stop, counts)
+    return _sort_ens(objs, n_stop, counts)
@@ -19,131 +19,25 @@ Author: generated by ChatGPT (assistant)
 
 import argparse
 import random
-import math
 import csv
-from copy import deepcopy
+import os
 
-random.seed(0)
-
-# ---------- Problem-specific functions ----------
-
-def zdt1(x):
-    # x: list of integers in [0,1000]
-    n = len(x)
-    x_real = [xi / 1000.0 for xi in x]  # normalization internal
-    f1 = x_real[0]
-    g = 1.0 + 9.0 * sum(x_real[1:]) / (n - 1)
-    h = 1.0 - math.sqrt(f1 / g)
-    f2 = g * h
-    return (f1, f2)
-
-def zdt3(x):
-    # x: list of reals in [0,1]
-    n = len(x)
-    f1 = x[0]
-    g = 1.0 + 9.0 * sum(x[1:]) / (n - 1)
-    h = 1.0 - math.sqrt(f1 / g) - (f1 / g) * math.sin(10 * math.pi * f1)
-    f2 = g * h
-    return (f1, f2)
-
-# ---------- Utilities: Non-dominated sort, crowding distance ----------
+import numpy as np
 
-def dominates(a, b):
-    # a and b are tuples (f1,f2); minimize both
-    return (a[0] <= b[0] and a[1] <= b[1]) and (a[0] < b[0] or a[1] < b[1])
+from checkpoint import load_checkpoint, save_checkpoint
+from crowding import crowding_distance_array, top_k_crowding
+from evaluators import EVALUATORS, CachedEvaluator, SerialEvaluator, make_evaluator
+from islands import TOPOLOGIES, island_nsga2
+from metrics import spacing
+from nondominated import fast_non_dominated_sort, peel_fronts, unique_rows
+from opcounts import OpCounters, write_metrics
+from operators import blx_alpha_crossover, crowded_tournament, random_reset_mutation, uniform_mutation
+from population import Population
+from problems import DELTA_RESYNC_INTERVAL, batch_kernel, zdt1_from_sums, zdt3_from_sums
+from runs import run_repetitions
+from timing import NULL_TIMER, PhaseTimer, format_phase_table
 
-def non_dominated_sort(pop_objs):
-    # pop_objs: list of tuples (objectives), returns fronts as lists of indices
-    S = [set() for _ in pop_objs]
-    n = [0 for _ in pop_objs]
-    fronts = [[]]
-    for p in range(len(pop_objs)):
-        for q in range(len(pop_objs)):
-            if dominates(pop_objs[p], pop_objs[q]):
-                S[p].add(q)
-            elif dominates(pop_objs[q], pop_objs[p]):
-                n[p] += 1
-        if n[p] == 0:
-            fronts[0].append(p)
-    i = 0
-    while fronts[i]:
-        next_front = []
-        for p in fronts[i]:
-            for q in list(S[p]):
-                n[q] -= 1
-                if n[q] == 0:
-                    next_front.append(q)
-        i += 1
-        fronts.append(next_front)
-    fronts.pop()  # last empty
-    return fronts
-
-def crowding_distance(pop_objs, front, fixed_bounds=None):
-    # fixed_bounds: ((f1_min,f1_max),(f2_min,f2_max)) used to normalize when provided
-    distances = {i:0.0 for i in front}
-    if not front:
-        return distances
-    # for each objective
-    for m in range(2):
-        values = [(pop_objs[i][m], i) for i in front]
-        values.sort(key=lambda x:x[0])
-        minv = values[0][0]
-        maxv = values[-1][0]
-        if fixed_bounds is not None:
-            if m == 0:
-                minv, maxv = fixed_bounds[0]
-            else:
-                minv, maxv = fixed_bounds[1]
-        # boundary points get infinite distance
-        distances[values[0][1]] = float('inf')
-        distances[values[-1][1]] = float('inf')
-        denom = maxv - minv
-        if denom == 0:
-            continue
-        for k in range(1, len(values)-1):
-            prevv = values[k-1][0]
-            nextv = values[k+1][0]
-            distances[values[k][1]] += (nextv - prevv) / denom
-    return distances
-
-# ---------- Selection and genetic operators ----------
-
-def tournament_selection(pop, pop_objs, k=2):
-    i1 = random.randrange(len(pop))
-    i2 = random.randrange(len(pop))
-    if dominates(pop_objs[i1], pop_objs[i2]):
-        return deepcopy(pop[i1])
-    elif dominates(pop_objs[i2], pop_objs[i1]):
-        return deepcopy(pop[i2])
-    else:
-        return deepcopy(pop[random.choice([i1,i2])])
-
-def blend_crossover(parent1, parent2, alpha=0.5, is_integer=False):
-    # BLX-alpha generalized for lists
-    child1 = []
-    child2 = []
-    for a, b in zip(parent1, parent2):
-        low = min(a,b) - alpha * abs(b - a)
-        high = max(a,b) + alpha * abs(b - a)
-        val1 = random.uniform(low, high)
-        val2 = random.uniform(low, high)
-        if is_integer:
-            child1.append(int(round(min(max(val1, 0), 1000))))
-            child2.append(int(round(min(max(val2, 0), 1000))))
-        else:
-            child1.append(min(max(val1, 0.0), 1.0))
-            child2.append(min(max(val2, 0.0), 1.0))
-    return child1, child2
-
-def mutation_integer_random_reset(individual, p_mut=0.01):
-    for i in range(len(individual)):
-        if random.random() < p_mut:
-            individual[i] = random.randint(0,1000)
-
-def mutation_real_uniform(individual, p_mut=0.01):
-    for i in range(len(individual)):
-        if random.random() < p_mut:
-            individual[i] = random.random()
+random.seed(0)
 
 # ---------- Metrics: Hypervolume and Spacing ----------
 
@@ -161,49 +55,104 @@ def hypervolume(front, ref_point):
             last_f1 = f1
     return hv
 
-def spacing(front):
-    # as defined in slides: measure distribution uniformity on the front
-    if len(front) <= 1:
-        return 0.0
-    d = []
-    for i in range(len(front)):
-        di = []
-        for j in range(len(front)):
-            if i==j: continue
-            dist = sum(abs(front[i][k] - front[j][k]) for k in range(2))
-            di.append(dist)
-        d.append(min(di))
-    mean_d = sum(d)/len(d)
-    var = sum((di - mean_d)**2 for di in d) / (len(d)-1) if len(d)>1 else 0.0
-    return math.sqrt(var)
-
 # ---------- Main evolutionary loop (NSGA-II) ----------
 
 def nsga2(problem='zdt1', pop_size=100, n_var=50, generations=250,
           p_crossover=0.9, p_mut=0.1, alpha=0.5, fixed_bounds=None, no_crowding=False, 
-          ref_point=None, track_convergence=False):
-    # initialize population
+          ref_point=None, track_convergence=False, evaluator=None, on_generation=None,
+          n_obj=2, delta_eval=False, dedup=False, checkpoint=None, checkpoint_every=10,
+          resume=False, metric_sink=None, timing=False, count_ops=False):
+    # evaluator: an evaluators.Evaluator receiving whole (rows, n_var) batches;
+    # defaults to the serial batched ZDT kernel for `problem`; n_obj is the
+    # number of objectives it returns (fronts use ENS-BS when n_obj != 2)
+    # on_generation(gen, pop): called after survival; may overwrite parent rows
+    # in place and returns True when it did, so the parents are ranked again
+    # (islands.island_nsga2 uses it for migration)
+    # delta_eval: carry each row's gene sum through variation and evaluate the
+    # built-in ZDT objectives from it (see problems.zdt1_from_sums)
+    # dedup: sort only one copy of every objective vector in the union; the
+    # repeats form a last front that is used only if the rest cannot fill it
+    # checkpoint: .npz path saved every `checkpoint_every` generations and at
+    # the end; with resume=True an existing file is continued from instead of
+    # starting over, with the same result as an uninterrupted run. Resuming
+    # with different run parameters, or with fewer generations than the
+    # checkpoint already ran, raises; timing and count_ops totals are saved
+    # too and carry over
+    # metric_sink: with track_convergence, e.g. a convergence_log.ConvergenceLog;
+    # each generation's metrics go to metric_sink.write(...) as they are known
+    # and the returned convergence_data lists stay empty
+    # timing: time every phase of the loop (see timing.py) and return the
+    # PhaseTimer summary as the last element
+    # count_ops: count sorting, crowding, survival and evaluation work (see
+    # opcounts.py) and return the OpCounters as the last element (after timing)
+    # initialize population: parents in the first half of the buffer
     is_integer = (problem=='zdt1')
-    pop = []
-    for _ in range(pop_size):
-        if is_integer:
-            pop.append([random.randint(0,1000) for _ in range(n_var)])
-        else:
-            pop.append([random.random() for _ in range(n_var)])
-
-    # evaluate
-    def eval_pop(pop):
-        objs = []
-        for ind in pop:
-            if problem=='zdt1':
-                objs.append(zdt1(ind))
+    if track_convergence and n_obj != 2:
+        raise ValueError('track_convergence needs two objectives (2-D hypervolume)')
+    if delta_eval and evaluator is not None:
+        raise ValueError('delta_eval uses the built-in ZDT objectives and cannot take an evaluator')
+    if delta_eval and problem not in ('zdt1', 'zdt3'):
+        raise ValueError('delta_eval only supports zdt1 and zdt3')
+    if checkpoint is not None and on_generation is not None:
+        raise ValueError('checkpoints do not capture on_generation state')
+    timer = PhaseTimer() if timing else NULL_TIMER
+    counts = OpCounters() if count_ops else None
+    pop = Population(pop_size, n_var, n_obj=n_obj, dtype=int if is_integer else float,
+                     gene_sums=delta_eval)
+    # batched operators draw from a NumPy generator that follows the `random` seed
+    rng = np.random.default_rng(random.getrandbits(64))
+    # parameters a checkpoint must agree with before it is resumed
+    run_config = dict(problem=problem, pop_size=pop_size, n_var=n_var, n_obj=n_obj,
+                      delta_eval=delta_eval, track_convergence=track_convergence,
+                      p_crossover=p_crossover, p_mut=p_mut, alpha=alpha,
+                      fixed_bounds=fixed_bounds, no_crowding=no_crowding, dedup=dedup,
+                      ref_point=ref_point)
+    resuming = resume and checkpoint is not None and os.path.exists(checkpoint)
+    if not resuming:
+        for ind in pop.parents:
+            if is_integer:
+                ind[:] = [random.randint(0,1000) for _ in range(n_var)]
             else:
-                objs.append(zdt3(ind))
-        return objs
+                ind[:] = [random.random() for _ in range(n_var)]
+
+    # evaluate a whole (rows, n_var) block into the matching objective rows
+    if evaluator is None:
+        evaluator = SerialEvaluator(batch_kernel(problem, n_obj), batched=True)
+    def eval_pop(genomes, out):
+        out[:] = evaluator.evaluate(genomes)
+    # cache counters are per process; this run's share is the difference
+    cache_start = (getattr(evaluator, 'hits', 0), getattr(evaluator, 'misses', 0))
+    def settle_cache_counts():
+        # move the cache hits/misses since the last call into counts
+        nonlocal cache_start
+        now = (getattr(evaluator, 'hits', 0), getattr(evaluator, 'misses', 0))
+        counts.add('cache_hits', now[0] - cache_start[0])
+        counts.add('cache_misses', now[1] - cache_start[1])
+        cache_start = now
+
+    # delta evaluation: objectives from x[0] and the carried gene sums
+    objs_from_sums = zdt1_from_sums if is_integer else zdt3_from_sums
+    def resync_parent_sums():
+        pop.parent_sums[:] = pop.parents[:, 1:].sum(axis=1)
+
+    # crowding distance of the given union rows (zeros without crowding)
+    def front_crowding(objs, front):
+        if no_crowding:
+            return np.zeros(len(front))
+        if counts is not None:
+            counts.add('crowding_calls')
+            counts.add('crowding_points', len(front))
+        return crowding_distance_array(objs, front, fixed_bounds=fixed_bounds)
+
+    # rank and crowding of the parents from scratch (initial population, migration)
+    def rank_parents():
+        fronts = fast_non_dominated_sort(pop.parent_objs, counts)
+        if counts is not None:
+            counts.count_fronts(fronts)
+        for r, front in enumerate(fronts):
+            pop.rank[front] = r
+            pop.crowding[front] = front_crowding(pop.parent_objs, front)
 
-    pop_objs = eval_pop(pop)
-    evals = pop_size
-    
     # Track convergence metrics per generation
     convergence_data = {
         'generation': [],
@@ -211,84 +160,183 @@ def nsga2(problem='zdt1', pop_size=100, n_var=50, generations=250,
         'spacing': [],
         'pareto_size': []
     }
+    if resuming:
+        # population, both generators, counters and history as saved
+        start_gen, evals, history, saved = load_checkpoint(checkpoint, run_config, pop, rng)
+        if start_gen > generations:
+            raise ValueError(f'checkpoint {checkpoint} is at generation {start_gen}, '
+                             f'past generations={generations}')
+        convergence_data.update(history)
+        # timer and counters continue when the checkpointed run kept them too
+        if timing and 'timing' in saved:
+            timer.restore(saved['timing'])
+        if count_ops and 'counts' in saved:
+            counts.values.update(saved['counts'])
+        if metric_sink is not None and track_convergence and ref_point is not None:
+            metric_sink.truncate(start_gen)
+    else:
+        if delta_eval:
+            resync_parent_sums()
+            pop.parent_objs[:] = objs_from_sums(pop.parents[:, 0], pop.parent_sums, n_var)
+        else:
+            eval_pop(pop.parents, pop.parent_objs)
+        evals = pop_size
+        if counts is not None:
+            counts.add('evaluations', pop_size)
+        rank_parents()
+        start_gen = 0
+    timer.lap('init')
+    # objective bytes of the last tracked first front; metrics are only
+    # recomputed when the first front changes
+    front_fingerprint = None
 
-    for gen in range(generations):
-        # create offspring
-        offspring = []
-        while len(offspring) < pop_size:
-            parent1 = tournament_selection(pop, pop_objs)
-            parent2 = tournament_selection(pop, pop_objs)
-            if random.random() < p_crossover:
-                child1, child2 = blend_crossover(parent1, parent2, alpha, is_integer=is_integer)
-            else:
-                child1, child2 = deepcopy(parent1), deepcopy(parent2)
-            # mutation
-            if is_integer:
-                mutation_integer_random_reset(child1, p_mut)
-                mutation_integer_random_reset(child2, p_mut)
-            else:
-                mutation_real_uniform(child1, p_mut)
-                mutation_real_uniform(child2, p_mut)
-            offspring.append(child1)
-            if len(offspring) < pop_size:
-                offspring.append(child2)
+    for gen in range(start_gen, generations):
+        timer.start_generation()
+        # create offspring directly in the second half of the buffer
+        parents, offspring = pop.parents, pop.offspring
+        # all binary tournaments at once, on the rank/crowding kept by survival
+        mates = crowded_tournament(pop.rank, pop.crowding, 2 * ((pop_size + 1) // 2), rng)
+        timer.lap('selection')
+        # BLX-alpha over the whole mating pool; pair k fills offspring rows 2k, 2k+1
+        child1, child2, crossed = blx_alpha_crossover(parents, mates[0::2], mates[1::2], rng, alpha,
+                                                      p_crossover, is_integer=is_integer)
+        offspring[0::2] = child1
+        offspring[1::2] = child2[:pop_size // 2]
+        if delta_eval:
+            # crossover children are summed directly; copies inherit their parent's sum
+            sums1 = pop.parent_sums[mates[0::2]]
+            sums2 = pop.parent_sums[mates[1::2]]
+            sums1[crossed] = child1[crossed, 1:].sum(axis=1)
+            sums2[crossed] = child2[crossed, 1:].sum(axis=1)
+            pop.offspring_sums[0::2] = sums1
+            pop.offspring_sums[1::2] = sums2[:pop_size // 2]
+        timer.lap('crossover')
+        # mutation: only the sampled gene positions are touched
+        if is_integer:
+            rows, cols, old = random_reset_mutation(offspring, p_mut, rng)
+        else:
+            rows, cols, old = uniform_mutation(offspring, p_mut, rng)
+        timer.lap('mutation')
         # evaluate offspring
-        off_objs = eval_pop(offspring)
+        if delta_eval:
+            tail = cols > 0
+            np.add.at(pop.offspring_sums, rows[tail], offspring[rows[tail], cols[tail]] - old[tail])
+            pop.offspring_objs[:] = objs_from_sums(offspring[:, 0], pop.offspring_sums, n_var)
+        else:
+            eval_pop(offspring, pop.offspring_objs)
         evals += pop_size
-        # merge
-        union = pop + offspring
-        union_objs = pop_objs + off_objs
-        fronts = non_dominated_sort(union_objs)
-        new_pop = []
-        new_objs = []
-        for front in fronts:
-            if len(new_pop) + len(front) <= pop_size:
+        timer.lap('evaluation')
+        # the whole buffer is the parent+offspring union; survival picks row indices
+        union_objs = pop.objs
+        # only the leading fronts that cover pop_size are ranked; the rest of
+        # the union is left unranked and cannot survive
+        if dedup:
+            first, repeats = unique_rows(union_objs)
+            fronts, _ = peel_fronts(union_objs[first], pop_size, counts)
+            fronts = [first[f] for f in fronts]
+            # too few distinct vectors: repeats fill the rest, after every front
+            repeats_used = len(first) < pop_size
+            if repeats_used:
+                fronts.append(repeats)
+        else:
+            fronts, _ = peel_fronts(union_objs, pop_size, counts)
+            repeats_used = False
+        if counts is not None:
+            counts.add('generations')
+            counts.add('evaluations', pop_size)
+            counts.count_fronts(fronts)
+        timer.lap('sorting')
+        selected = []
+        n_sel = 0
+        for r, front in enumerate(fronts):
+            # crowding distance (possibly with fixed bounds), aligned with front;
+            # kept for the survivors' tournaments
+            front = np.asarray(front)
+            dist = front_crowding(union_objs, front)
+            remaining = pop_size - n_sel
+            if len(front) > remaining and counts is not None:
+                counts.add('overflow_events')
+                counts.add('overflow_discarded', len(front) - remaining)
+                counts.observe_max('overflow_size_max', len(front))
+            if len(front) <= remaining:
                 # include entire front
-                for idx in front:
-                    new_pop.append(union[idx])
-                    new_objs.append(union_objs[idx])
+                chosen = np.arange(len(front))
+            elif no_crowding:
+                # choose randomly among this front to fill remaining slots
+                chosen = np.asarray(random.sample(range(len(front)), remaining))
             else:
-                # need partial fill
-                if no_crowding:
-                    # choose randomly among this front to fill remaining slots
-                    remaining = pop_size - len(new_pop)
-                    chosen = random.sample(front, remaining)
-                    for idx in chosen:
-                        new_pop.append(union[idx])
-                        new_objs.append(union_objs[idx])
-                else:
-                    # compute crowding distance (possibly with fixed bounds)
-                    dist = crowding_distance(union_objs, front, fixed_bounds=fixed_bounds)
-                    # sort by distance descending (infinite first)
-                    sorted_front = sorted(front, key=lambda i: (dist[i] if dist[i] != float('inf') else 1e9), reverse=True)
-                    remaining = pop_size - len(new_pop)
-                    for idx in sorted_front[:remaining]:
-                        new_pop.append(union[idx])
-                        new_objs.append(union_objs[idx])
+                # take the `remaining` most isolated (infinite first) without sorting the front
+                chosen = top_k_crowding(dist, remaining)
+            selected.extend(front[chosen].tolist())
+            pop.rank[n_sel:n_sel + len(chosen)] = r
+            pop.crowding[n_sel:n_sel + len(chosen)] = dist[chosen]
+            n_sel += len(chosen)
+            if n_sel == pop_size:
                 break
-        pop = new_pop
-        pop_objs = new_objs
+        pop.survive(selected)
+        pop_objs = pop.parent_objs
+        timer.lap('crowding')
+        replaced = on_generation is not None and on_generation(gen, pop)
+        if replaced:
+            rank_parents()
+            if delta_eval:
+                resync_parent_sums()
+        elif delta_eval and not is_integer and (gen + 1) % DELTA_RESYNC_INTERVAL == 0:
+            resync_parent_sums()
+        timer.lap('other')
         
         # Track convergence metrics if requested
         if track_convergence and ref_point is not None:
-            fronts_temp = non_dominated_sort(pop_objs)
-            pareto_temp = [pop_objs[i] for i in fronts_temp[0]]
-            if pareto_temp:
+            if not (replaced or repeats_used):
+                # survival takes union front 0 first, so the first front of the
+                # new population is its leading rows
+                front_objs = pop_objs[:min(len(fronts[0]), pop_size)]
+            else:
+                # the hook replaced rows, or copies of front-0 vectors survived
+                # as repeats at the end of the population; sort again
+                front_objs = pop_objs[fast_non_dominated_sort(pop_objs, counts)[0]]
+            fingerprint = front_objs.tobytes()
+            if fingerprint != front_fingerprint:
+                pareto_temp = front_objs.tolist()
                 hv_temp = hypervolume(pareto_temp, ref_point)
                 sp_temp = spacing(pareto_temp)
+                front_fingerprint = fingerprint
+            if len(front_objs) and metric_sink is not None:
+                metric_sink.write(gen + 1, hv_temp, sp_temp, len(front_objs))
+            elif len(front_objs):
                 convergence_data['generation'].append(gen + 1)
                 convergence_data['hypervolume'].append(hv_temp)
                 convergence_data['spacing'].append(sp_temp)
-                convergence_data['pareto_size'].append(len(pareto_temp))
+                convergence_data['pareto_size'].append(len(front_objs))
+        timer.lap('metrics')
+
+        if checkpoint is not None and ((gen + 1) % checkpoint_every == 0 or gen + 1 == generations):
+            if metric_sink is not None:
+                metric_sink.flush()
+            saved = {}
+            if timing:
+                saved['timing'] = timer.summary()
+            if count_ops:
+                settle_cache_counts()
+                saved['counts'] = counts.to_dict()
+            save_checkpoint(checkpoint, run_config, pop, rng, gen + 1, evals, convergence_data, saved)
+            timer.lap('other')
 
     # final non-dominated front from last population
-    fronts = non_dominated_sort(pop_objs)
+    pop_objs = pop.parent_objs
+    fronts = fast_non_dominated_sort(pop_objs, counts)
     pareto_idx = fronts[0]
-    pareto = [pop_objs[i] for i in pareto_idx]
+    pareto = [tuple(o) for o in pop_objs[pareto_idx].tolist()]
     
+    result = (pareto, evals)
     if track_convergence:
-        return pareto, evals, convergence_data
-    return pareto, evals
+        result += (convergence_data,)
+    if timing:
+        result += (timer.summary(),)
+    if count_ops:
+        settle_cache_counts()
+        result += (counts,)
+    return result
 
 # ---------- CLI ----------
 
@@ -298,6 +346,30 @@ def parse_args():
     parser.add_argument('--gen', type=int, default=250)
     parser.add_argument('--nvar', type=int, default=50)
     parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0, help='master seed; run i is seeded from (seed, i)')
+    parser.add_argument('--jobs', type=int, default=1, help='number of worker processes for independent runs')
+    parser.add_argument('--evaluator', choices=sorted(EVALUATORS), default='serial',
+                        help='backend used to evaluate each generation\'s offspring')
+    parser.add_argument('--eval-workers', type=int, default=None, help='workers for thread/process evaluators (default: all cores)')
+    parser.add_argument('--islands', type=int, default=1, help='island-model NSGA-II with this many populations (one process each)')
+    parser.add_argument('--migration-interval', type=int, default=10, help='generations between island migrations')
+    parser.add_argument('--migrants', type=int, default=5, help='individuals sent by each island per migration')
+    parser.add_argument('--topology', choices=TOPOLOGIES, default='ring', help='island migration topology')
+    parser.add_argument('--cache-size', type=int, default=0,
+                        help='memoise objective values of up to this many distinct genomes (LRU, 0 = off)')
+    parser.add_argument('--dedup', action='store_true',
+                        help='keep repeated objective vectors out of the sort; they only fill leftover slots')
+    parser.add_argument('--delta-eval', action='store_true',
+                        help='evaluate ZDT objectives from per-individual gene sums updated by mutation')
+    parser.add_argument('--checkpoint-dir', default=None,
+                        help='save each run\'s state to DIR/run<i>.npz so it can be resumed')
+    parser.add_argument('--checkpoint-every', type=int, default=10, help='generations between checkpoints')
+    parser.add_argument('--resume', action='store_true', help='continue runs from their checkpoints in --checkpoint-dir')
+    parser.add_argument('--timing', action='store_true', help='print the time spent in each phase of the generation loop')
+    parser.add_argument('--metrics-out', default=None, help='write per-run operation counters to this file')
+    parser.add_argument('--metrics-format', choices=('prom', 'json'), default='prom',
+                        help='Prometheus text exposition or JSON for --metrics-out')
+    parser.add_argument('--chunk-size', type=int, default=None, help='genomes per evaluation task (default: one chunk per worker)')
     parser.add_argument('--ref', type=float, nargs=2, default=None, help='reference point for Hypervolume (r1 r2)')
     parser.add_argument('--no-crowd', action='store_true', help='run NSGA-II but when last front overflows select randomly')
     parser.add_argument('--fixed-ref-bounds', type=float, nargs=4, default=None,
@@ -308,14 +380,46 @@ def main(problem, filename):
     args = parse_args()
     hv_list = []
     spacing_list = []
-    for run in range(args.runs):
-        fixed_bounds = None
-        if args.fixed_ref_bounds:
-            fixed_bounds = ((args.fixed_ref_bounds[0], args.fixed_ref_bounds[1]),
-                            (args.fixed_ref_bounds[2], args.fixed_ref_bounds[3]))
-        pareto, evals = nsga2(problem=problem, pop_size=args.pop, n_var=args.nvar,
-                              generations=args.gen, p_crossover=0.9, p_mut=0.05,
-                              alpha=0.5, fixed_bounds=fixed_bounds, no_crowding=args.no_crowd)
+    fixed_bounds = None
+    if args.fixed_ref_bounds:
+        fixed_bounds = ((args.fixed_ref_bounds[0], args.fixed_ref_bounds[1]),
+                        (args.fixed_ref_bounds[2], args.fixed_ref_bounds[3]))
+    evaluator = make_evaluator(args.evaluator, batch_kernel(problem),
+                               batched=True, chunk_size=args.chunk_size, workers=args.eval_workers)
+    if args.cache_size > 0:
+        evaluator = CachedEvaluator(evaluator, max_size=args.cache_size)
+    run_kwargs = {}
+    if args.checkpoint_dir is not None:
+        if args.islands > 1:
+            raise SystemExit('--checkpoint-dir does not support --islands')
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+        run_kwargs = dict(checkpoint_every=args.checkpoint_every, resume=args.resume,
+                          per_run=lambda run: {'checkpoint': os.path.join(args.checkpoint_dir, f'run{run}.npz')})
+    elif args.resume:
+        raise SystemExit('--resume needs --checkpoint-dir')
+    if args.timing:
+        if args.islands > 1:
+            raise SystemExit('--timing does not support --islands')
+        run_kwargs['timing'] = True
+    if args.metrics_out is not None:
+        if args.islands > 1:
+            raise SystemExit('--metrics-out does not support --islands')
+        run_kwargs['count_ops'] = True
+    if args.islands > 1:
+        # each run is an island model; every island still runs nsga2()
+        run_kwargs = dict(nsga2_fn=nsga2, n_islands=args.islands,
+                          migration_interval=args.migration_interval,
+                          n_migrants=args.migrants, topology=args.topology)
+    # runs are seeded independently, so results do not depend on --jobs
+    with evaluator:
+        results = run_repetitions(island_nsga2 if args.islands > 1 else nsga2, args.runs,
+                                  master_seed=args.seed, jobs=args.jobs, **run_kwargs,
+                                  problem=problem, pop_size=args.pop, n_var=args.nvar,
+                                  generations=args.gen, p_crossover=0.9, p_mut=0.05,
+                                  alpha=0.5, fixed_bounds=fixed_bounds, no_crowding=args.no_crowd,
+                                  dedup=args.dedup,
+                                  **({'delta_eval': True} if args.delta_eval else {'evaluator': evaluator}))
+    for run, (pareto, evals, *extra) in enumerate(results):
         if args.ref is None:
             # automatic ref point: slightly worse than max observed in pareto
             maxf1 = max(p[0] for p in pareto) if pareto else 1.0
@@ -336,6 +440,21 @@ def main(problem, filename):
         return (min(lst), sum(lst)/len(lst), max(lst))
     print('\\nHV stats (min, mean, max):', stats(hv_list))
     print('Spacing stats (min, mean, max):', stats(spacing_list))
+    if isinstance(evaluator, CachedEvaluator) and not args.delta_eval:
+        if args.jobs <= 1 and args.islands <= 1:
+            c = evaluator.stats()
+            print(f'Evaluation cache: saved={c["hits"]} computed={c["misses"]} (cached genomes={c["size"]})')
+        else:
+            print('Evaluation cache: counters stay in the worker processes (use --jobs 1 --islands 1 to report them)')
+    # trailing result elements: timing summary, then operation counters
+    extras = [extra for _, _, *extra in results]
+    if args.metrics_out is not None:
+        write_metrics(args.metrics_out, [extra.pop() for extra in extras], args.metrics_format,
+                      prefix='nsga2', labels={'problem': problem})
+        print(f'Operation counters written to {args.metrics_out}')
+    if args.timing:
+        print(f'\nTime per phase over {args.runs} run(s):')
+        print(format_phase_table([extra[-1] for extra in extras]))
 
 if __name__ == '__main__':
     import sys
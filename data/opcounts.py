@@ -0,0 +1,91 @@
+"""Operation counters for optimizer runs.
+
+`nsga2(count_ops=True)` and the random searches (`count_ops=True`) fill an
+OpCounters and return it as the last element of their result. It counts
+algorithmic work rather than time, so complexity claims can be checked and
+regressions caught regardless of machine noise:
+
+- dominance_comparisons: comparisons made by the sorters and the archive.
+  For ENS-BS each front member tested against a point counts once; the 2-D
+  sorter and ParetoArchive2D count every key comparison of their binary
+  searches.
+- evaluations, cache_hits, cache_misses: objective evaluations and, with a
+  CachedEvaluator, how many of them it answered.
+- fronts_ranked, points_ranked, front_size_max: fronts produced by the sorts.
+- crowding_calls, crowding_points: crowding distance invocations and their
+  front sizes.
+- overflow_events, overflow_discarded, overflow_size_max: last fronts that did
+  not fit, and the members survival had to drop from them.
+
+`format_prometheus` and `format_json` render the counters of several runs for
+the CLIs' --metrics-out.
+"""
+
+import json
+
+# name -> (kind, help); kind 'max' keeps the largest observation instead of a sum
+COUNTERS = {
+    'generations': ('sum', 'generations run'),
+    'evaluations': ('sum', 'objective evaluations'),
+    'cache_hits': ('sum', 'evaluations answered by the genome cache'),
+    'cache_misses': ('sum', 'evaluations the genome cache passed on'),
+    'dominance_comparisons': ('sum', 'point-against-point dominance tests'),
+    'fronts_ranked': ('sum', 'non-dominated fronts produced'),
+    'points_ranked': ('sum', 'points placed on a front'),
+    'front_size_max': ('max', 'largest front'),
+    'crowding_calls': ('sum', 'crowding distance computations'),
+    'crowding_points': ('sum', 'points given a crowding distance'),
+    'overflow_events': ('sum', 'last fronts larger than the free slots'),
+    'overflow_discarded': ('sum', 'last-front members dropped by survival'),
+    'overflow_size_max': ('max', 'largest overflowing front'),
+    'archive_candidates': ('sum', 'points offered to the archive'),
+    'archive_accepted': ('sum', 'points that entered the archive'),
+}
+
+
+class OpCounters:
+
+    def __init__(self):
+        self.values = dict.fromkeys(COUNTERS, 0)
+
+    def add(self, name, n=1):
+        self.values[name] += n
+
+    def observe_max(self, name, value):
+        if value > self.values[name]:
+            self.values[name] = value
+
+    def count_fronts(self, fronts):
+        self.values['fronts_ranked'] += len(fronts)
+        for front in fronts:
+            self.values['points_ranked'] += len(front)
+            self.observe_max('front_size_max', len(front))
+
+    def to_dict(self):
+        return dict(self.values)
+
+
+def format_json(counters, labels=None):
+    # counters: one OpCounters per run; labels: optional dict added to every run
+    runs = [{'run': run, **(labels or {}), **c.to_dict()} for run, c in enumerate(counters)]
+    return json.dumps(runs, indent=2)
+
+
+def format_prometheus(counters, prefix, labels=None):
+    # text exposition format, one sample per counter and run
+    lines = []
+    for name, (kind, help_text) in COUNTERS.items():
+        metric = f'{prefix}_{name}' if kind == 'max' else f'{prefix}_{name}_total'
+        lines.append(f'# HELP {metric} {help_text}')
+        lines.append(f'# TYPE {metric} {"gauge" if kind == "max" else "counter"}')
+        for run, c in enumerate(counters):
+            label_text = ','.join(f'{k}="{v}"' for k, v in {'run': run, **(labels or {})}.items())
+            lines.append(f'{metric}{{{label_text}}} {c.values[name]}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_metrics(path, counters, fmt, prefix, labels=None):
+    # fmt: 'prom' or 'json'
+    text = format_prometheus(counters, prefix, labels) if fmt == 'prom' else format_json(counters, labels)
+    with open(path, 'w') as f:
+        f.write(text)
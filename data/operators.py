@@ -0,0 +1,100 @@
+"""Batched variation operators for `nsga2()`.
+
+The operators work on whole index arrays and genome matrices and draw their
+randomness from a NumPy Generator, instead of one Python call per parent.
+`nsga2()` seeds that generator from the module-level `random` state, so runs
+stay reproducible from `--seed`.
+
+- crowded_tournament: all binary tournaments of a generation at once;
+- blx_alpha_crossover: BLX-alpha over every mating pair in one set of array
+  operations, including the integer rounding and clamping of ZDT1;
+- random_reset_mutation / uniform_mutation: draw the mutated positions of
+  the whole (pop, n_var) matrix directly (geometric gaps between Bernoulli
+  successes) and reset them in one scatter, so the cost follows the number
+  of mutated genes rather than pop * n_var.
+"""
+
+import numpy as np
+
+
+def crowded_tournament(rank, crowding, n, rng):
+    # n binary tournaments under the crowded-comparison operator: lower rank
+    # wins, then larger crowding distance, then a fair coin. rank and crowding
+    # are the per-parent arrays kept by the last survival step.
+    # Returns the (n,) winner indices; genomes are never copied here.
+    pairs = rng.integers(0, len(rank), size=(n, 2))
+    a, b = pairs[:, 0], pairs[:, 1]
+    ra, rb = rank[a], rank[b]
+    ca, cb = crowding[a], crowding[b]
+    a_better = (ra < rb) | ((ra == rb) & (ca > cb))
+    b_better = (rb < ra) | ((ra == rb) & (cb > ca))
+    coin = rng.random(n) < 0.5
+    return np.where(a_better | (~b_better & coin), a, b)
+
+
+def blx_alpha_crossover(parents, idx1, idx2, rng, alpha=0.5, p_crossover=0.9, is_integer=False):
+    # BLX-alpha for whole mating pools: pair k crosses parents[idx1[k]] and
+    # parents[idx2[k]] with probability p_crossover, otherwise its children are
+    # copies of the parents. Genes are clamped to [0,1000] and rounded
+    # (integers) or clamped to [0,1] (reals). Returns two (pairs, n_var) matrices
+    # and the (pairs,) mask of pairs that actually crossed.
+    p1 = parents[idx1].astype(float)
+    p2 = parents[idx2].astype(float)
+    spread = alpha * np.abs(p2 - p1)
+    low = np.minimum(p1, p2) - spread
+    width = np.maximum(p1, p2) + spread - low
+    child1 = low + width * rng.random(p1.shape)
+    child2 = low + width * rng.random(p1.shape)
+    upper = 1000.0 if is_integer else 1.0
+    np.clip(child1, 0.0, upper, out=child1)
+    np.clip(child2, 0.0, upper, out=child2)
+    if is_integer:
+        np.rint(child1, out=child1)
+        np.rint(child2, out=child2)
+    # pairs that skip crossover pass their parents through unchanged
+    crossed = rng.random(len(p1)) < p_crossover
+    child1[~crossed] = p1[~crossed]
+    child2[~crossed] = p2[~crossed]
+    return child1, child2, crossed
+
+
+def bernoulli_sites(total, p, rng):
+    # sorted positions in range(total), each included independently with
+    # probability p, drawn as geometric gaps: O(number of sites), not O(total)
+    if total == 0 or p <= 0:
+        return np.empty(0, dtype=np.intp)
+    if p >= 1:
+        return np.arange(total)
+    sites = []
+    last = -1
+    while last < total - 1:
+        # enough gaps to run past the end with high probability
+        expected = (total - 1 - last) * p
+        n_gaps = int(expected + 4 * np.sqrt(expected) + 8)
+        pos = last + np.cumsum(rng.geometric(p, size=n_gaps))
+        sites.append(pos[pos < total])
+        last = pos[-1]
+    return np.concatenate(sites)
+
+
+def _mutation_sites(genomes, p_mut, rng):
+    rows, cols = np.divmod(bernoulli_sites(genomes.size, p_mut, rng), genomes.shape[1])
+    return rows, cols
+
+
+def random_reset_mutation(genomes, p_mut, rng):
+    # integer genomes: every gene is reset to U{0..1000} with probability p_mut;
+    # mutates in place and returns the (rows, cols) that changed and their old values
+    rows, cols = _mutation_sites(genomes, p_mut, rng)
+    old = genomes[rows, cols]
+    genomes[rows, cols] = rng.integers(0, 1001, size=len(rows))
+    return rows, cols, old
+
+
+def uniform_mutation(genomes, p_mut, rng):
+    # real genomes: every gene is redrawn from U[0,1) with probability p_mut;
+    # mutates in place and returns the (rows, cols) that changed and their old values
+    rows, cols = _mutation_sites(genomes, p_mut, rng)
+    old = genomes[rows, cols]
+    genomes[rows, cols] = rng.random(len(rows))
+    return rows, cols, old
@@ -0,0 +1,66 @@
+"""Array-backed population used by the NSGA-II scripts.
+
+Parents live in rows [:size] and offspring in rows [size:] of one
+preallocated buffer, so the parent+offspring union of a generation is simply
+the whole buffer. Survival gathers the chosen union rows into a second buffer
+of the same shape and swaps the two, which means a generation never allocates
+per-individual objects (no lists, no deepcopy).
+"""
+
+import numpy as np
+
+
+class Population:
+
+    def __init__(self, size, n_var, n_obj=2, dtype=float, gene_sums=False):
+        self.size = size
+        self.genomes = np.empty((2 * size, n_var), dtype=dtype)
+        self.objs = np.empty((2 * size, n_obj), dtype=float)
+        # optional sum of genes 1..n_var-1 of every row (delta evaluation)
+        self.gene_sums = np.zeros(2 * size, dtype=self.genomes.sum(axis=1).dtype) if gene_sums else None
+        # front index and crowding distance of every parent, set by survival
+        self.rank = np.zeros(size, dtype=int)
+        self.crowding = np.zeros(size)
+        # survival target, swapped with the live buffers after every gather
+        self._genomes_spare = np.empty_like(self.genomes)
+        self._objs_spare = np.empty_like(self.objs)
+        self._sums_spare = np.empty_like(self.gene_sums) if gene_sums else None
+
+    # views on the two halves of the buffer
+    @property
+    def parents(self):
+        return self.genomes[:self.size]
+
+    @property
+    def parent_objs(self):
+        return self.objs[:self.size]
+
+    @property
+    def parent_sums(self):
+        return self.gene_sums[:self.size]
+
+    @property
+    def offspring_sums(self):
+        return self.gene_sums[self.size:]
+
+    @property
+    def offspring(self):
+        return self.genomes[self.size:]
+
+    @property
+    def offspring_objs(self):
+        return self.objs[self.size:]
+
+    def survive(self, selected):
+        # selected: `size` row indices into the union (the whole buffer),
+        # in the order the survivors should take as the next parents
+        idx = np.asarray(selected, dtype=np.intp)
+        if len(idx) != self.size:
+            raise ValueError(f'survival must select {self.size} rows, got {len(idx)}')
+        np.take(self.genomes, idx, axis=0, out=self._genomes_spare[:self.size])
+        np.take(self.objs, idx, axis=0, out=self._objs_spare[:self.size])
+        self.genomes, self._genomes_spare = self._genomes_spare, self.genomes
+        self.objs, self._objs_spare = self._objs_spare, self.objs
+        if self.gene_sums is not None:
+            np.take(self.gene_sums, idx, out=self._sums_spare[:self.size])
+            self.gene_sums, self._sums_spare = self._sums_spare, self.gene_sums
@@ -7,53 +7,73 @@ Run: python3 random_zdt1.py --pop 100 --gen 250 --runs 10
 This script follows the report spec: number of evaluations = pop_size * generations
 """
 
-import argparse, random, math
-random.seed(0)
+import argparse, random
+
+import numpy as np
 
-def zdt1(x):
-    n = len(x)
-    x_real = [xi / 1000.0 for xi in x]
-    f1 = x_real[0]
-    g = 1.0 + 9.0 * sum(x_real[1:]) / (n - 1)
-    h = 1.0 - math.sqrt(f1 / g)
-    f2 = g * h
-    return (f1,f2)
+from archive import ParetoArchive2D, skyline_2d
+from metrics import spacing
+from opcounts import OpCounters, write_metrics
+from problems import zdt1_batch, zdt3_batch
+from runs import run_repetitions
 
-def zdt3(x):
-    n = len(x)
-    f1 = x[0]
-    g = 1.0 + 9.0 * sum(x[1:]) / (n - 1)
-    h = 1.0 - math.sqrt(f1 / g) - (f1 / g) * math.sin(10 * math.pi * f1)
-    f2 = g * h
-    return (f1,f2)
+random.seed(0)
 
-def dominates(a,b):
-    return (a[0] <= b[0] and a[1] <= b[1]) and (a[0] < b[0] or a[1] < b[1])
+# candidates generated and evaluated together by random_search
+EVAL_BLOCK = 1000
 
-def update_nondominated(nd_set, cand):
-    non_dom = []
-    dominated = False
-    for p in nd_set:
-        if dominates(p, cand):
-            dominated = True
-            break
-        if not dominates(cand, p):
-            non_dom.append(p)
-    if not dominated:
-        non_dom.append(cand)
-    return non_dom
+def _archive_counts(nd, num_evals, candidates):
+    # operation counters of one search; see opcounts.py
+    counts = OpCounters()
+    counts.add('evaluations', num_evals)
+    counts.add('archive_candidates', candidates)
+    counts.add('archive_accepted', nd.inserted)
+    counts.add('dominance_comparisons', nd.comparisons)
+    return counts
 
-def random_search(problem, n_var, num_evals):
-    nd = []
-    for _ in range(num_evals):
+def random_search(problem, n_var, num_evals, count_ops=False):
+    # candidates are drawn in the same order as before, but each block of
+    # EVAL_BLOCK genomes is evaluated with one batched kernel call
+    # f1-ordered archive: O(log n) dominance checks per candidate
+    # count_ops: return (points, OpCounters)
+    nd = ParetoArchive2D()
+    done = 0
+    while done < num_evals:
+        block = min(EVAL_BLOCK, num_evals - done)
         if problem=='zdt1':
-            x = [random.randint(0,1000) for _ in range(n_var)]
-            obj = zdt1(x)
+            X = np.array([[random.randint(0,1000) for _ in range(n_var)] for _ in range(block)])
+            objs = zdt1_batch(X)
         else:
-            x = [random.random() for _ in range(n_var)]
-            obj = zdt3(x)
-        nd = update_nondominated(nd, obj)
-    return nd
+            X = np.array([[random.random() for _ in range(n_var)] for _ in range(block)])
+            objs = zdt3_batch(X)
+        nd.update(objs.tolist())
+        done += block
+    if count_ops:
+        return nd.points(), _archive_counts(nd, num_evals, num_evals)
+    return nd.points()
+
+def random_search_batched(problem, n_var, num_evals, batch_size=10000, count_ops=False):
+    # same evaluation budget, sampled with NumPy in (batch_size, n_var) chunks;
+    # each chunk is reduced to its own skyline before it reaches the archive,
+    # so memory is bounded by the chunk size
+    rng = np.random.default_rng(random.getrandbits(64))  # follows the run seed
+    eval_batch = zdt1_batch if problem=='zdt1' else zdt3_batch
+    nd = ParetoArchive2D()
+    done = 0
+    candidates = 0
+    while done < num_evals:
+        block = min(batch_size, num_evals - done)
+        if problem=='zdt1':
+            X = rng.integers(0, 1001, size=(block, n_var))
+        else:
+            X = rng.random((block, n_var))
+        sky = skyline_2d(eval_batch(X))
+        candidates += len(sky)
+        nd.update(sky.tolist())
+        done += block
+    if count_ops:
+        return nd.points(), _archive_counts(nd, num_evals, candidates)
+    return nd.points()
 
 def hypervolume(front, ref_point):
     pts = sorted(front, key=lambda x: x[0], reverse=True)
@@ -67,21 +87,6 @@ def hypervolume(front, ref_point):
             last_f1 = f1
     return hv
 
-def spacing(front):
-    if len(front) <= 1:
-        return 0.0
-    d = []
-    for i in range(len(front)):
-        di = []
-        for j in range(len(front)):
-            if i==j: continue
-            dist = sum(abs(front[i][k] - front[j][k]) for k in range(2))
-            di.append(dist)
-        d.append(min(di))
-    mean_d = sum(d)/len(d)
-    var = sum((di - mean_d)**2 for di in d) / (len(d)-1) if len(d)>1 else 0.0
-    return math.sqrt(var)
-
 def parse_args():
     import argparse
     parser = argparse.ArgumentParser()
@@ -89,7 +94,14 @@ def parse_args():
     parser.add_argument('--gen', type=int, default=250)
     parser.add_argument('--nvar', type=int, default=50)
     parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0, help='master seed; run i is seeded from (seed, i)')
+    parser.add_argument('--jobs', type=int, default=1, help='number of worker processes for independent runs')
     parser.add_argument('--ref', type=float, nargs=2, default=None)
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help='sample and evaluate candidates in NumPy chunks of this size')
+    parser.add_argument('--metrics-out', default=None, help='write per-run operation counters to this file')
+    parser.add_argument('--metrics-format', choices=('prom', 'json'), default='prom',
+                        help='Prometheus text exposition or JSON for --metrics-out')
     return parser.parse_args()
 
 def main(problem, filename):
@@ -97,8 +109,21 @@ def main(problem, filename):
     num_evals = args.pop * args.gen
     hv_list = []
     sp_list = []
-    for run in range(args.runs):
-        nd = random_search(problem, args.nvar, num_evals)
+    # runs are seeded independently, so results do not depend on --jobs
+    count_ops = args.metrics_out is not None
+    if args.batch_size:
+        results = run_repetitions(random_search_batched, args.runs, master_seed=args.seed,
+                                  jobs=args.jobs, problem=problem, n_var=args.nvar,
+                                  num_evals=num_evals, batch_size=args.batch_size, count_ops=count_ops)
+    else:
+        results = run_repetitions(random_search, args.runs, master_seed=args.seed, jobs=args.jobs,
+                                  problem=problem, n_var=args.nvar, num_evals=num_evals,
+                                  count_ops=count_ops)
+    if count_ops:
+        write_metrics(args.metrics_out, [counts for _, counts in results], args.metrics_format,
+                      prefix='random_search', labels={'problem': problem})
+        results = [points for points, _ in results]
+    for run, nd in enumerate(results):
         if args.ref is None:
             maxf1 = max(p[0] for p in nd) if nd else 1.0
             maxf2 = max(p[1] for p in nd) if nd else 1.0
@@ -117,6 +142,8 @@ def main(problem, filename):
         return (min(lst), sum(lst)/len(lst), max(lst))
     print('\\nHV stats (min, mean, max):', stats(hv_list))
     print('Spacing stats (min, mean, max):', stats(sp_list))
+    if count_ops:
+        print(f'Operation counters written to {args.metrics_out}')
 
 if __name__=='__main__':
     main(problem='zdt1', filename='random_zdt1.py')
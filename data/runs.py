@@ -0,0 +1,36 @@
+"""Independent repetitions for the `main()` CLIs, optionally across processes.
+
+Every run reseeds the module-level `random` generator with its own seed,
+derived from a master seed and the run index only, so a single run can be
+reproduced on its own and results never depend on how runs are spread over
+workers. With jobs > 1 the runs go to a ProcessPoolExecutor; results always
+come back in run order.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def run_seed(master_seed, run):
+    # deterministic, well-mixed seed for repetition `run`
+    return int(np.random.SeedSequence([master_seed, run]).generate_state(1)[0])
+
+
+def _seeded_call(task):
+    fn, seed, kwargs = task
+    random.seed(seed)
+    return fn(**kwargs)
+
+
+def run_repetitions(fn, n_runs, master_seed=0, jobs=1, per_run=None, **kwargs):
+    # calls fn(**kwargs) once per run; fn must be a module-level function.
+    # per_run(run) may return extra keyword arguments for that run only (it is
+    # called here, so it does not need to be picklable)
+    tasks = [(fn, run_seed(master_seed, run), {**kwargs, **(per_run(run) if per_run else {})})
+             for run in range(n_runs)]
+    if jobs <= 1 or n_runs <= 1:
+        return [_seeded_call(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(jobs, n_runs)) as executor:
+        return list(executor.map(_seeded_call, tasks))
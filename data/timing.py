@@ -0,0 +1,86 @@
+"""Opt-in per-phase wall-clock timers for the NSGA-II generation loop.
+
+`nsga2(timing=True)` keeps a PhaseTimer and calls `lap(phase)` at the end of
+every phase, so each phase is charged the `perf_counter_ns` time elapsed
+since the previous lap. Times are accumulated per generation and per run.
+Without timing, `NULL_TIMER` takes the same calls and does nothing, so the
+loop carries no measurement code of its own.
+
+Phases (in loop order): selection, crossover, mutation, evaluation, sorting
+(deduplication and front peeling), crowding (crowding distance and survivor
+choice), other (hooks, sum resync, checkpoints) and metrics (convergence
+tracking). `init` is the initial population and its evaluation, outside the
+per-generation breakdown.
+"""
+
+from time import perf_counter_ns
+
+PHASES = ('init', 'selection', 'crossover', 'mutation', 'evaluation', 'sorting', 'crowding',
+          'other', 'metrics')
+
+
+class PhaseTimer:
+
+    def __init__(self):
+        self.totals = dict.fromkeys(PHASES, 0)
+        self.per_generation = []
+        self._current = None
+        self._last = perf_counter_ns()
+
+    def start_generation(self):
+        self._current = dict.fromkeys(PHASES, 0)
+        self.per_generation.append(self._current)
+        self._last = perf_counter_ns()
+
+    def lap(self, phase):
+        now = perf_counter_ns()
+        elapsed = now - self._last
+        self.totals[phase] += elapsed
+        if self._current is not None:
+            self._current[phase] += elapsed
+        self._last = now
+
+    def restore(self, summary):
+        # continue from an earlier summary(), e.g. one saved in a checkpoint
+        self.totals.update(summary['totals_ns'])
+        per_generation = summary['per_generation_ns']
+        self.per_generation = [{phase: per_generation[phase][g] for phase in PHASES}
+                               for g in range(summary['generations'])]
+
+    def summary(self):
+        # {'generations': n, 'totals_ns': {phase: ns}, 'per_generation_ns': {phase: [ns, ...]}}
+        return {
+            'generations': len(self.per_generation),
+            'totals_ns': dict(self.totals),
+            'per_generation_ns': {phase: [g[phase] for g in self.per_generation] for phase in PHASES},
+        }
+
+
+class _NullTimer:
+
+    def start_generation(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+def format_phase_table(summaries):
+    # summaries: PhaseTimer.summary() of one or more runs; returns a text table
+    # of the time per phase summed over runs
+    totals = dict.fromkeys(PHASES, 0)
+    generations = 0
+    for summary in summaries:
+        generations += summary['generations']
+        for phase in PHASES:
+            totals[phase] += summary['totals_ns'][phase]
+    grand = sum(totals.values()) or 1
+    lines = [f'{"phase":<12}{"total ms":>12}{"ms/gen":>10}{"share":>8}']
+    for phase in PHASES:
+        per_gen = '' if phase == 'init' or not generations else f'{totals[phase] / generations / 1e6:.3f}'
+        lines.append(f'{phase:<12}{totals[phase] / 1e6:>12.2f}{per_gen:>10}{100 * totals[phase] / grand:>7.1f}%')
+    lines.append(f'{"total":<12}{grand / 1e6:>12.2f}')
+    return '\n'.join(lines)
@@ -16,6 +16,8 @@ from pathlib import Path
 # Importar os algoritmos
 from nsga2_zdt1 import nsga2 as nsga2_zdt1_func, hypervolume, spacing
 from nsga2_zdt3 import nsga2 as nsga2_zdt3_func
+from convergence_log import ConvergenceLog, read_convergence_log
+from convergence_store import save_convergence, store_path
 
 # Configurações
 POP_SIZE = 100
@@ -30,6 +32,10 @@ FIXED_BOUNDS_ZDT3 = ((0.0, 1.0), (-1.0, 1.0))
 # Diretório de saída
 OUTPUT_DIR = Path("convergence_data")
 OUTPUT_DIR.mkdir(exist_ok=True)
+# Logs por execução, uma linha JSON por geração (podem ser acompanhados com tail -f)
+LOG_DIR = OUTPUT_DIR / "logs"
+LOG_DIR.mkdir(exist_ok=True)
+LOG_FLUSH_EVERY = 10
 
 print("=" * 70)
 print("COLETANDO DADOS DE CONVERGÊNCIA")
@@ -48,21 +54,25 @@ def collect_convergence(problem, algorithm_name, nsga2_func, ref_point, fixed_bo
     for run in range(N_RUNS):
         print(f"  Run {run + 1}/{N_RUNS}...", end=" ", flush=True)
         
-        result = nsga2_func(
-            problem=problem,
-            pop_size=POP_SIZE,
-            n_var=N_VAR,
-            generations=GENERATIONS,
-            p_crossover=0.9,
-            p_mut=0.05,
-            alpha=0.5,
-            fixed_bounds=fixed_bounds,
-            no_crowding=no_crowding,
-            ref_point=ref_point,
-            track_convergence=True
-        )
+        log_path = LOG_DIR / f"{algorithm_name}_{problem}_run{run}.jsonl"
+        with ConvergenceLog(log_path, flush_every=LOG_FLUSH_EVERY) as log:
+            result = nsga2_func(
+                problem=problem,
+                pop_size=POP_SIZE,
+                n_var=N_VAR,
+                generations=GENERATIONS,
+                p_crossover=0.9,
+                p_mut=0.05,
+                alpha=0.5,
+                fixed_bounds=fixed_bounds,
+                no_crowding=no_crowding,
+                ref_point=ref_point,
+                track_convergence=True,
+                metric_sink=log
+            )
         
-        pareto, evals, convergence_data = result
+        pareto, evals, _ = result
+        convergence_data = read_convergence_log(log_path)
         all_runs_data.append(convergence_data)
         
         print(f"✓ (Pareto final: {len(pareto)} soluções)")
@@ -91,22 +101,24 @@ def collect_convergence(problem, algorithm_name, nsga2_func, ref_point, fixed_bo
         avg_data['pareto_size_mean'].append(np.mean(sizes))
         avg_data['pareto_size_std'].append(np.std(sizes))
     
-    # Salvar dados
+    # Salvar dados (JSON legível + arrays colunares lidos pelos gráficos)
     filename = OUTPUT_DIR / f"{algorithm_name}_{problem}_convergence.json"
+    config = {
+        'algorithm': algorithm_name,
+        'problem': problem,
+        'pop_size': POP_SIZE,
+        'generations': GENERATIONS,
+        'n_var': N_VAR,
+        'n_runs': N_RUNS,
+        'ref_point': ref_point
+    }
     with open(filename, 'w') as f:
         json.dump({
-            'config': {
-                'algorithm': algorithm_name,
-                'problem': problem,
-                'pop_size': POP_SIZE,
-                'generations': GENERATIONS,
-                'n_var': N_VAR,
-                'n_runs': N_RUNS,
-                'ref_point': ref_point
-            },
+            'config': config,
             'averaged_data': avg_data,
             'all_runs': all_runs_data
         }, f, indent=2)
+    save_convergence(store_path(filename), config, avg_data, all_runs_data)
     
     print(f"  ✓ Dados salvos: {filename}")
     
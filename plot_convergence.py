@@ -4,11 +4,15 @@ Script para gerar gráficos de convergência com dados REAIS
 Lê os dados coletados por generate_convergence_data.py e gera visualizações
 """
 
-import json
+import sys
+sys.path.insert(0, 'data')
+
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+from convergence_store import load_convergence
+
 # Diretórios
 DATA_DIR = Path("convergence_data")
 OUTPUT_DIR = Path("plots")
@@ -31,15 +35,16 @@ LABELS = {
 }
 
 def load_convergence_data(algorithm, problem):
-    """Carrega dados de convergência de um arquivo JSON"""
+    """Carrega dados de convergência (arrays mapeados em memória, com cache)
+
+    O JSON é convertido para o formato colunar na primeira leitura.
+    """
     filename = DATA_DIR / f"{algorithm}_{problem}_convergence.json"
-    if not filename.exists():
+    data = load_convergence(filename)
+    if data is None:
         print(f"⚠️  Arquivo não encontrado: {filename}")
         return None
     
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    
     return data['averaged_data']
 
 def plot_hypervolume_convergence():
@@ -304,7 +309,7 @@ def main():
         print("Execute primeiro: python3 generate_convergence_data.py")
         return
     
-    data_files = list(DATA_DIR.glob("*.json"))
+    data_files = list(DATA_DIR.glob("*.json")) or list(DATA_DIR.glob("*_convergence/header.json"))
     if not data_files:
         print(f"\n❌ ERRO: Nenhum arquivo de dados encontrado em {DATA_DIR}!")
         print("Execute primeiro: python3 generate_convergence_data.py")
@@ -0,0 +1,33 @@
+import numpy as np
+
+from archive import ParetoArchive2D, skyline_2d
+
+
+def dominates(a, b):
+    return a[0] <= b[0] and a[1] <= b[1] and (a[0] < b[0] or a[1] < b[1])
+
+
+def test_archive_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        points = [tuple(p) for p in rng.integers(0, 15, size=(150, 2)).astype(float).tolist()]
+        archive = ParetoArchive2D()
+        ref = []
+        for p in points:
+            entered = archive.add(p)
+            assert entered == (not any(dominates(q, p) for q in ref))
+            if entered:
+                ref = [q for q in ref if not dominates(p, q)] + [p]
+        # insertion order, duplicates kept
+        assert archive.points() == ref
+        assert archive.comparisons > 0
+
+
+def test_skyline_feeds_the_same_archive():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        objs = rng.integers(0, 10, size=(80, 2)).astype(float)
+        direct, via_skyline = ParetoArchive2D(), ParetoArchive2D()
+        direct.update(objs.tolist())
+        via_skyline.update(skyline_2d(objs).tolist())
+        assert sorted(direct.points()) == sorted(via_skyline.points())
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+import nsga2_zdt3
+from convergence_log import ConvergenceLog, read_convergence_log
+
+
+BASE = dict(problem='zdt3', pop_size=20, n_var=6, p_mut=0.05, track_convergence=True,
+            ref_point=(1.2, 6.0))
+
+
+@pytest.mark.parametrize('options', [{}, {'delta_eval': True}, {'no_crowding': True, 'dedup': True}])
+def test_resume_is_bit_identical(tmp_path, options):
+    random.seed(5)
+    full = nsga2_zdt3.nsga2(generations=30, **BASE, **options)
+    path = str(tmp_path / 'run.npz')
+    random.seed(5)
+    nsga2_zdt3.nsga2(generations=13, checkpoint=path, checkpoint_every=4, **BASE, **options)
+    random.seed(99)  # the checkpoint, not the caller's seed, drives the rest
+    resumed = nsga2_zdt3.nsga2(generations=30, checkpoint=path, resume=True, **BASE, **options)
+    assert resumed == full
+
+
+def test_resume_rejects_other_parameters(tmp_path):
+    path = str(tmp_path / 'run.npz')
+    random.seed(5)
+    nsga2_zdt3.nsga2(generations=4, checkpoint=path, **BASE)
+    with pytest.raises(ValueError):
+        nsga2_zdt3.nsga2(generations=8, checkpoint=path, resume=True, **{**BASE, 'p_mut': 0.1})
+    with pytest.raises(ValueError):
+        nsga2_zdt3.nsga2(generations=8, checkpoint=path, resume=True, **{**BASE, 'ref_point': (2.0, 6.0)})
+    # the checkpoint is already past a shorter run
+    with pytest.raises(ValueError):
+        nsga2_zdt3.nsga2(generations=3, checkpoint=path, resume=True, **BASE)
+    # resuming a finished run returns its result
+    random.seed(5)
+    finished = nsga2_zdt3.nsga2(generations=4, **BASE)
+    assert nsga2_zdt3.nsga2(generations=4, checkpoint=path, resume=True, **BASE) == finished
+
+
+def test_streamed_log_survives_resume(tmp_path):
+    random.seed(5)
+    full = nsga2_zdt3.nsga2(generations=30, **BASE)
+    path, log_path = str(tmp_path / 'run.npz'), str(tmp_path / 'log.jsonl')
+    with ConvergenceLog(log_path, flush_every=3) as log:
+        random.seed(5)
+        nsga2_zdt3.nsga2(generations=13, checkpoint=path, checkpoint_every=4, metric_sink=log, **BASE)
+    # a log reopened without append=True has lost generations 1..13
+    with ConvergenceLog(str(tmp_path / 'other.jsonl')) as log:
+        with pytest.raises(ValueError):
+            nsga2_zdt3.nsga2(generations=30, checkpoint=path, resume=True, metric_sink=log, **BASE)
+    with ConvergenceLog(log_path, append=True) as log:
+        nsga2_zdt3.nsga2(generations=30, checkpoint=path, resume=True, metric_sink=log, **BASE)
+    assert read_convergence_log(log_path) == full[2]
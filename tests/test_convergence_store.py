@@ -0,0 +1,49 @@
+import json
+import os
+
+import numpy as np
+
+from convergence_store import load_convergence, store_path
+
+
+def write_json(path, scale):
+    data = {
+        'config': {'pop_size': 10},
+        'averaged_data': {'generation': [1, 2, 3], 'hypervolume_mean': [0.1 * scale, 0.2, 0.3]},
+        'all_runs': [{'hypervolume': [0.1, 0.2, 0.3]}, {'hypervolume': [0.2, 0.4]}],
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+    return data
+
+
+def test_round_trip(tmp_path):
+    json_path = tmp_path / 'nsga2_zdt1_convergence.json'
+    data = write_json(json_path, 1)
+    loaded = load_convergence(json_path)
+    assert (store_path(json_path) / 'header.json').exists()
+    assert loaded['config'] == data['config']
+    for field, values in data['averaged_data'].items():
+        assert loaded['averaged_data'][field].tolist() == values
+    # runs of unequal length are padded with NaN
+    runs = loaded['all_runs']['hypervolume']
+    assert runs.shape == (2, 3)
+    assert runs[0].tolist() == [0.1, 0.2, 0.3]
+    assert runs[1, :2].tolist() == [0.2, 0.4] and np.isnan(runs[1, 2])
+    # cached until the store changes
+    assert load_convergence(json_path) is loaded
+    assert load_convergence(tmp_path / 'missing_convergence.json') is None
+
+
+def test_newer_json_is_converted_again(tmp_path):
+    json_path = tmp_path / 'nsga2_zdt3_convergence.json'
+    write_json(json_path, 1)
+    assert load_convergence(json_path)['averaged_data']['hypervolume_mean'][0] == 0.1
+    write_json(json_path, 5)
+    header = store_path(json_path) / 'header.json'
+    stamp = header.stat().st_mtime_ns
+    os.utime(json_path, ns=(stamp + 10**9, stamp + 10**9))
+    assert load_convergence(json_path)['averaged_data']['hypervolume_mean'][0] == 0.5
+    # the store alone is enough once the JSON file is gone
+    os.remove(json_path)
+    assert load_convergence(json_path)['averaged_data']['hypervolume_mean'][0] == 0.5
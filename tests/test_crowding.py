@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from crowding import crowding_distance_array, crowding_order, top_k_crowding
+
+
+def reference_crowding(objs, front, fixed_bounds=None):
+    # the dict-based crowding distance the scripts used before crowding.py
+    distances = {i: 0.0 for i in front}
+    for m in range(objs.shape[1]):
+        values = sorted(((objs[i][m], i) for i in front), key=lambda x: x[0])
+        minv, maxv = values[0][0], values[-1][0]
+        if fixed_bounds is not None:
+            minv, maxv = fixed_bounds[m]
+        distances[values[0][1]] = float('inf')
+        distances[values[-1][1]] = float('inf')
+        denom = maxv - minv
+        if denom == 0:
+            continue
+        for k in range(1, len(values) - 1):
+            distances[values[k][1]] += (values[k + 1][0] - values[k - 1][0]) / denom
+    return distances
+
+
+@pytest.mark.parametrize('fixed_bounds', [None, ((0.0, 5.0), (-1.0, 6.0))])
+def test_matches_dict_version_exactly(fixed_bounds):
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        objs = rng.integers(0, 6, size=(40, 2)).astype(float)
+        front = sorted(rng.choice(40, size=int(rng.integers(1, 40)), replace=False).tolist())
+        dist = crowding_distance_array(objs, front, fixed_bounds=fixed_bounds)
+        ref = reference_crowding(objs, front, fixed_bounds)
+        assert dist.tolist() == [ref[i] for i in front]
+
+
+def test_top_k_is_prefix_of_stable_order():
+    rng = np.random.default_rng(1)
+    for _ in range(500):
+        n = int(rng.integers(1, 40))
+        # few distinct values and several inf, so ties are everywhere
+        dist = rng.choice([0.0, 0.5, 1.0, np.inf], size=n)
+        k = int(rng.integers(0, n + 2))
+        assert top_k_crowding(dist, k).tolist() == crowding_order(dist)[:k].tolist()
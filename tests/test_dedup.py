@@ -0,0 +1,23 @@
+import random
+
+import numpy as np
+
+import nsga2_zdt3
+from evaluators import SerialEvaluator
+from problems import zdt3_batch
+
+
+def rounded_zdt3(X):
+    # integer objectives: the population collapses onto a few distinct vectors
+    return np.rint(zdt3_batch(X))
+
+
+def test_tracking_counts_surviving_repeats():
+    random.seed(6)
+    pareto, _, data = nsga2_zdt3.nsga2(problem='zdt3', pop_size=30, n_var=8, generations=25,
+                                       dedup=True, track_convergence=True, ref_point=(2.0, 10.0),
+                                       evaluator=SerialEvaluator(rounded_zdt3, batched=True))
+    # far fewer distinct vectors than pop_size, so repeats took part in survival
+    assert len(set(pareto)) < len(pareto)
+    assert data['pareto_size'][-1] == len(pareto)
+    assert data['generation'] == list(range(1, 26))
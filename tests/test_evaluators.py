@@ -0,0 +1,17 @@
+import numpy as np
+
+from evaluators import CachedEvaluator, SerialEvaluator
+from problems import zdt1_batch
+
+
+def test_cache_returns_inner_values_and_counts():
+    cache = CachedEvaluator(SerialEvaluator(zdt1_batch, batched=True), max_size=8)
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 3, size=(40, 2))  # many repeats within the batch
+    assert np.array_equal(cache.evaluate(X), zdt1_batch(X))
+    distinct = len(np.unique(X, axis=0))
+    assert cache.misses == distinct
+    assert cache.hits == len(X) - distinct
+    assert cache.stats()['size'] == min(8, distinct)
+    # entries are copies, not views into the evaluated batch
+    assert all(value.base is None for value in cache._cache.values())
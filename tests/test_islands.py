@@ -0,0 +1,55 @@
+import random
+
+import numpy as np
+import pytest
+
+import nsga2_zdt3
+from islands import island_nsga2, migration_targets
+
+SMALL = dict(problem='zdt3', pop_size=20, n_var=6, generations=12)
+
+
+def dominates(a, b):
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+@pytest.mark.parametrize('topology', ['ring', 'random'])
+def test_migration_targets_form_one_cycle(topology):
+    for migration in range(1, 6):
+        dest = migration_targets(5, topology, seed=3, migration=migration)
+        # a permutation without fixed points that visits every island
+        assert sorted(dest) == list(range(5))
+        island, seen = 0, set()
+        for _ in range(5):
+            seen.add(island)
+            island = dest[island]
+        assert island == 0 and seen == set(range(5))
+    assert list(migration_targets(4, 'ring', 0, 1)) == [1, 2, 3, 0]
+    with pytest.raises(ValueError):
+        migration_targets(4, 'star', 0, 1)
+
+
+def test_random_topology_is_shared_by_all_islands():
+    first = migration_targets(6, 'random', seed=11, migration=2)
+    assert np.array_equal(first, migration_targets(6, 'random', seed=11, migration=2))
+
+
+@pytest.mark.parametrize('delta_eval', [False, True])
+def test_noop_hook_leaves_the_run_unchanged(delta_eval):
+    random.seed(5)
+    plain = nsga2_zdt3.nsga2(delta_eval=delta_eval, **SMALL)
+    random.seed(5)
+    hooked = nsga2_zdt3.nsga2(delta_eval=delta_eval, on_generation=lambda gen, pop: False, **SMALL)
+    assert plain == hooked
+
+
+def test_islands_merge_into_one_front():
+    random.seed(2)
+    pareto, evals = island_nsga2(nsga2_zdt3.nsga2, n_islands=2, migration_interval=4,
+                                 n_migrants=3, seed=9, **SMALL)
+    assert evals == 2 * SMALL['pop_size'] * (SMALL['generations'] + 1)
+    assert pareto
+    assert not any(dominates(a, b) for a in pareto for b in pareto)
+    # the seed alone fixes the result
+    assert island_nsga2(nsga2_zdt3.nsga2, n_islands=2, migration_interval=4,
+                        n_migrants=3, seed=9, **SMALL) == (pareto, evals)
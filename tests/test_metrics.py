@@ -0,0 +1,30 @@
+import math
+
+import numpy as np
+
+from metrics import spacing
+
+
+def reference_spacing(front):
+    # the original O(N^2) implementation from the scripts
+    if len(front) <= 1:
+        return 0.0
+    d = []
+    for i in range(len(front)):
+        d.append(min(sum(abs(front[i][k] - front[j][k]) for k in range(2))
+                     for j in range(len(front)) if j != i))
+    mean_d = sum(d) / len(d)
+    var = sum((di - mean_d) ** 2 for di in d) / (len(d) - 1) if len(d) > 1 else 0.0
+    return math.sqrt(var)
+
+
+def test_spacing_is_bit_identical():
+    rng = np.random.default_rng(0)
+    for n in list(range(0, 6)) + [30, 200]:
+        # a mutually non-dominated front (sorted fast path) ...
+        f1 = np.sort(rng.random(n))
+        front = list(zip(f1.tolist(), (1.0 - np.sqrt(f1)).tolist()))
+        assert spacing(front) == reference_spacing(front)
+        # ... and an arbitrary point set with duplicates (general path)
+        pts = [tuple(p) for p in rng.integers(0, 5, size=(n, 2)).astype(float).tolist()]
+        assert spacing(pts) == reference_spacing(pts)
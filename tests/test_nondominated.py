@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from nondominated import (_Cutoff, fast_non_dominated_sort, non_dominated_sort_2d,
+                          non_dominated_sort_ens, peel_fronts, unique_rows)
+from opcounts import OpCounters
+
+
+def dominates(a, b):
+    return bool(np.all(a <= b) and np.any(a < b))
+
+
+def reference_fronts(objs):
+    # all-pairs peeling; fronts as sorted index lists
+    remaining = set(range(len(objs)))
+    fronts = []
+    while remaining:
+        front = sorted(p for p in remaining
+                       if not any(dominates(objs[q], objs[p]) for q in remaining if q != p))
+        fronts.append(front)
+        remaining -= set(front)
+    return fronts
+
+
+def random_objs(rng, n, m):
+    # small integer grid, so ties and duplicates are common
+    return rng.integers(0, 6, size=(n, m)).astype(float)
+
+
+@pytest.mark.parametrize('m', [2, 3])
+def test_peel_fronts_returns_leading_fronts(m):
+    rng = np.random.default_rng(10 + m)
+    for _ in range(150):
+        n = int(rng.integers(1, 60))
+        objs = random_objs(rng, n, m)
+        full = reference_fronts(objs)
+        n_stop = int(rng.integers(1, n + 1))
+        fronts, unranked = peel_fronts(objs, n_stop)
+        # exactly the fronts up to the first one that reaches n_stop
+        sizes = np.cumsum([len(f) for f in full])
+        cut = int(np.searchsorted(sizes, n_stop)) + 1
+        assert fronts == full[:cut]
+        assert sorted(unranked) == unranked
+        assert sorted(unranked + [i for f in fronts for i in f]) == list(range(n))
+
+
+def test_peel_fronts_empty_input():
+    assert peel_fronts(np.empty((0, 3)), 5) == ([], [])
+
+
+def test_cutoff_limit_tracks_running_sizes():
+    # place() against a recomputation of the limit from the front sizes
+    rng = np.random.default_rng(3)
+    for _ in range(300):
+        n_stop = int(rng.integers(1, 30))
+        cutoff = _Cutoff(n_stop)
+        sizes = []
+        for _ in range(int(rng.integers(1, 80))):
+            k = int(rng.integers(0, cutoff.limit + 1))
+            cutoff.place(k)
+            if k == len(sizes):
+                sizes.append(0)
+            sizes[k] += 1
+            running = np.cumsum(sizes)
+            reached = np.flatnonzero(running >= n_stop)
+            limit = int(reached[0]) if len(reached) else len(sizes)
+            assert cutoff.sizes == sizes
+            assert cutoff.limit == limit
+            assert cutoff.below == sum(sizes[:limit])
+
+
+def test_2d_sort_matches_all_pairs():
+    rng = np.random.default_rng(2)
+    for _ in range(150):
+        objs = random_objs(rng, int(rng.integers(1, 50)), 2)
+        assert non_dominated_sort_2d(objs) == reference_fronts(objs)
+    assert non_dominated_sort_2d(np.empty((0, 2))) == []
+
+
+@pytest.mark.parametrize('m', [2, 3, 4])
+def test_full_sort_matches_all_pairs(m):
+    rng = np.random.default_rng(m)
+    for _ in range(150):
+        objs = random_objs(rng, int(rng.integers(1, 50)), m)
+        assert fast_non_dominated_sort(objs) == reference_fronts(objs)
+
+
+def test_2d_and_ens_agree():
+    rng = np.random.default_rng(7)
+    for _ in range(100):
+        objs = rng.random((int(rng.integers(1, 80)), 2))
+        assert non_dominated_sort_2d(objs) == non_dominated_sort_ens(objs)
+
+
+def test_empty_input():
+    assert fast_non_dominated_sort(np.empty((0, 2))) == []
+    assert peel_fronts(np.empty((0, 3)), 5) == ([], [])
+
+
+def test_unique_rows():
+    objs = np.array([[1.0, 2.0], [0.0, 1.0], [1.0, 2.0], [0.0, 1.0], [3.0, 3.0]])
+    first, repeats = unique_rows(objs)
+    assert first.tolist() == [0, 1, 4]
+    assert repeats.tolist() == [2, 3]
+
+
+def test_counts_are_recorded():
+    rng = np.random.default_rng(4)
+    for m in (2, 3):
+        counts = OpCounters()
+        objs = rng.random((100, m))
+        assert fast_non_dominated_sort(objs, counts) == fast_non_dominated_sort(objs)
+        assert counts.values['dominance_comparisons'] > 0
+    # the 2-D sort counts its binary-search steps: O(n log n), far below all pairs
+    counts = OpCounters()
+    fast_non_dominated_sort(rng.random((1000, 2)), counts)
+    assert 1000 < counts.values['dominance_comparisons'] <= 1000 * (np.log2(1000) + 1)
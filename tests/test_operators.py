@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from operators import bernoulli_sites, blx_alpha_crossover, random_reset_mutation
+
+
+@pytest.mark.parametrize('is_integer', [False, True])
+def test_pairs_without_crossover_pass_parents_through(is_integer):
+    rng = np.random.default_rng(0)
+    if is_integer:
+        parents = rng.integers(0, 1001, size=(30, 8))
+    else:
+        parents = rng.random((30, 8))
+    idx1 = rng.integers(0, 30, size=400)
+    idx2 = rng.integers(0, 30, size=400)
+    child1, child2, crossed = blx_alpha_crossover(parents, idx1, idx2, rng, p_crossover=0.6,
+                                                  is_integer=is_integer)
+    assert np.array_equal(child1[~crossed], parents[idx1[~crossed]])
+    assert np.array_equal(child2[~crossed], parents[idx2[~crossed]])
+    assert abs(crossed.mean() - 0.6) < 0.08
+    upper = 1000 if is_integer else 1
+    assert child1.min() >= 0 and child1.max() <= upper
+    if is_integer:
+        assert np.array_equal(child1, np.rint(child1))
+    assert not blx_alpha_crossover(parents, idx1, idx2, rng, p_crossover=0.0)[2].any()
+    assert blx_alpha_crossover(parents, idx1, idx2, rng, p_crossover=1.0)[2].all()
+
+
+@pytest.mark.parametrize('p', [0.01, 0.1, 0.5])
+def test_bernoulli_sites_frequencies(p):
+    rng = np.random.default_rng(3)
+    total, draws = 200, 4000
+    hits = np.zeros(total)
+    for _ in range(draws):
+        sites = bernoulli_sites(total, p, rng)
+        assert np.all(np.diff(sites) > 0)
+        assert len(sites) == 0 or (sites[0] >= 0 and sites[-1] < total)
+        hits[sites] += 1
+    # every position is included with probability p, independently of the others
+    freq = hits / draws
+    tolerance = 5 * np.sqrt(p * (1 - p) / draws)
+    assert np.all(np.abs(freq - p) < tolerance)
+    assert abs(freq.mean() - p) < tolerance / 5
+    assert len(bernoulli_sites(total, 0.0, rng)) == 0
+    assert bernoulli_sites(total, 1.0, rng).tolist() == list(range(total))
+    assert len(bernoulli_sites(0, p, rng)) == 0
+
+
+def test_mutation_reports_changed_genes():
+    rng = np.random.default_rng(4)
+    genomes = rng.integers(0, 1001, size=(20, 10))
+    before = genomes.copy()
+    rows, cols, old = random_reset_mutation(genomes, 0.2, rng)
+    assert np.array_equal(old, before[rows, cols])
+    untouched = np.ones(genomes.shape, dtype=bool)
+    untouched[rows, cols] = False
+    assert np.array_equal(genomes[untouched], before[untouched])
+    assert genomes.min() >= 0 and genomes.max() <= 1000
@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+
+from problems import batch_kernel, dtlz2_batch, zdt1_batch
+
+
+def test_batch_kernel_objective_counts():
+    X = np.random.default_rng(0).random((7, 10))
+    assert batch_kernel('zdt1') is zdt1_batch
+    for n_obj in (2, 3, 5):
+        F = batch_kernel('dtlz2', n_obj)(X)
+        assert F.shape == (7, n_obj)
+        assert np.array_equal(F, dtlz2_batch(X, n_obj))
+    with pytest.raises(ValueError):
+        batch_kernel('zdt1', 3)
+    with pytest.raises(ValueError):
+        batch_kernel('dtlz7')
@@ -0,0 +1,23 @@
+import random
+
+from runs import run_repetitions, run_seed
+
+
+def draw(n):
+    # module-level, so worker processes can run it
+    return [random.random() for _ in range(n)]
+
+
+def test_results_do_not_depend_on_jobs():
+    serial = run_repetitions(draw, 4, master_seed=7, jobs=1, n=3)
+    parallel = run_repetitions(draw, 4, master_seed=7, jobs=2, n=3)
+    assert serial == parallel
+    # runs are seeded independently from (master_seed, run)
+    assert len({tuple(r) for r in serial}) == 4
+    random.seed(run_seed(7, 2))
+    assert draw(3) == serial[2]
+
+
+def test_per_run_arguments():
+    results = run_repetitions(draw, 3, per_run=lambda run: {'n': run + 1})
+    assert [len(r) for r in results] == [1, 2, 3]